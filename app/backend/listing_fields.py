@@ -15,18 +15,26 @@ limitations under the License.
 """Structured representation of the fields required to render a listing."""
 
 import re
+import sys
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from textwrap import dedent
 from typing import Any, Mapping, Optional
 import unicodedata
 
-from app.backend.defect_catalog import iter_prompt_defects, known_defect_slugs
+from app.backend.defect_catalog import (
+    DEFECT_CATALOG,
+    iter_prompt_defects,
+    known_defect_slugs,
+)
 from app.backend.text_normalization import normalize_model_code
 
 
 FieldValue = Optional[str]
 
+# ``slots=True`` requires Python 3.10; the standalone build still targets 3.8.
+_DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 def _normalize_text(value: str) -> str:
     """Normalize text for accent-insensitive comparisons."""
@@ -116,7 +124,47 @@ _EUROPE_COUNTRY_KEYWORDS = (
 )
 
 
-@dataclass
+# Keys the model must return, resolved once per template instead of per parse.
+_ALWAYS_REQUIRED_FIELDS = (
+    "model",
+    "us_w",
+    "us_l",
+    "fit_leg",
+    "rise_class",
+    "rise_measurement_cm",
+    "waist_measurement_cm",
+    "cotton_pct",
+    "polyester_pct",
+    "polyamide_pct",
+    "viscose_pct",
+    "elastane_pct",
+    "acrylic_pct",
+    "gender",
+    "color_main",
+    "defects",
+    "sku",
+)
+_MEASUREMENT_FIELDS = (
+    "bust_flat_measurement_cm",
+    "length_measurement_cm",
+    "sleeve_measurement_cm",
+    "shoulder_measurement_cm",
+    "waist_flat_measurement_cm",
+    "hem_flat_measurement_cm",
+)
+_POLAIRE_ADDITIONAL_FIELDS = ("neckline_style", "special_logo")
+
+# Templates keyed below make ``fr_size`` optional; any other template requires it.
+_DEFAULT_REQUIRED_FIELDS = ("fr_size",) + _ALWAYS_REQUIRED_FIELDS
+_REQUIRED_FIELDS_BY_TEMPLATE: dict[str, tuple[str, ...]] = {
+    "template-polaire-outdoor": (
+        _ALWAYS_REQUIRED_FIELDS + _MEASUREMENT_FIELDS + _POLAIRE_ADDITIONAL_FIELDS
+    ),
+    "template-pull-tommy-femme": _ALWAYS_REQUIRED_FIELDS + _MEASUREMENT_FIELDS,
+}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ListingFields:
     """Structured data extracted from the model response."""
 
@@ -170,55 +218,9 @@ class ListingFields:
     ) -> "ListingFields":
         template_normalized = (template_name or "").strip().lower()
 
-        optional_fr_size_templates = {
-            "template-polaire-outdoor",
-            "template-pull-tommy-femme",
-        }
-
-        always_required_fields = (
-            "model",
-            "us_w",
-            "us_l",
-            "fit_leg",
-            "rise_class",
-            "rise_measurement_cm",
-            "waist_measurement_cm",
-            "cotton_pct",
-            "polyester_pct",
-            "polyamide_pct",
-            "viscose_pct",
-            "elastane_pct",
-            "acrylic_pct",
-            "gender",
-            "color_main",
-            "defects",
-            "sku",
+        required_fields = _REQUIRED_FIELDS_BY_TEMPLATE.get(
+            template_normalized, _DEFAULT_REQUIRED_FIELDS
         )
-        measurement_fields = (
-            "bust_flat_measurement_cm",
-            "length_measurement_cm",
-            "sleeve_measurement_cm",
-            "shoulder_measurement_cm",
-            "waist_flat_measurement_cm",
-            "hem_flat_measurement_cm",
-        )
-
-        required_fields: tuple[str, ...]
-        polaire_additional_fields = ("neckline_style", "special_logo")
-
-        fr_size_required = template_normalized not in optional_fr_size_templates
-        base_fields: tuple[str, ...]
-        if fr_size_required:
-            base_fields = ("fr_size",) + always_required_fields
-        else:
-            base_fields = always_required_fields
-
-        if template_normalized == "template-polaire-outdoor":
-            required_fields = base_fields + measurement_fields + polaire_additional_fields
-        elif template_normalized == "template-pull-tommy-femme":
-            required_fields = base_fields + measurement_fields
-        else:
-            required_fields = base_fields
 
         missing = [key for key in required_fields if key not in data]
         if missing:
@@ -827,14 +829,13 @@ class ListingFields:
             raise ValueError("'defect_tags' doit être une liste de slugs")
 
         slugs = []
-        valid_slugs = set(known_defect_slugs())
         for item in raw_iterable:
             if not isinstance(item, str):
                 raise ValueError("Chaque élément de 'defect_tags' doit être une chaîne")
             slug = item.strip()
             if not slug:
                 continue
-            if slug not in valid_slugs:
+            if slug not in DEFECT_CATALOG:
                 raise ValueError(f"Slug de défaut inconnu: {slug}")
             slugs.append(slug)
         return tuple(slugs)
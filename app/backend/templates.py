@@ -18,6 +18,7 @@ import re
 import unicodedata
 
 from dataclasses import dataclass
+from functools import lru_cache
 from textwrap import dedent
 from typing import Callable, Dict, List, Optional, Tuple, Union
 
@@ -45,6 +46,10 @@ def _clean(value: Optional[str]) -> str:
     return (value or "").strip()
 
 
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_MULTI_X_SIZE_PATTERN = re.compile(r"(\d+)X")
+
+
 def _normalize_apparel_fr_size(value: Optional[str]) -> str:
     """Normalize apparel size labels to a consistent FR-friendly format."""
 
@@ -52,8 +57,8 @@ def _normalize_apparel_fr_size(value: Optional[str]) -> str:
     if not cleaned:
         return ""
 
-    collapsed = re.sub(r"\s+", "", cleaned).upper()
-    match = re.fullmatch(r"(\d+)X", collapsed)
+    collapsed = _WHITESPACE_PATTERN.sub("", cleaned).upper()
+    match = _MULTI_X_SIZE_PATTERN.fullmatch(collapsed)
     if not match:
         return cleaned
 
@@ -65,6 +70,10 @@ def _normalize_apparel_fr_size(value: Optional[str]) -> str:
     return f"{count}XL"
 
 
+_US_WAIST_LABEL_PATTERN = re.compile(r"(?i)w\s*([0-9]{2,3})")
+_US_WAIST_NUMBER_PATTERN = re.compile(r"([0-9]{2,3})")
+
+
 def _normalize_us_waist_label(value: Optional[str]) -> str:
     """Normalize US waist label strings (e.g. "W33", "33/32") to a numeric token."""
 
@@ -72,11 +81,11 @@ def _normalize_us_waist_label(value: Optional[str]) -> str:
     if not cleaned:
         return ""
 
-    match = re.search(r"(?i)w\s*([0-9]{2,3})", cleaned)
+    match = _US_WAIST_LABEL_PATTERN.search(cleaned)
     if match:
         return match.group(1)
 
-    match = re.search(r"([0-9]{2,3})", cleaned)
+    match = _US_WAIST_NUMBER_PATTERN.search(cleaned)
     if match:
         return match.group(1)
 
@@ -84,6 +93,13 @@ def _normalize_us_waist_label(value: Optional[str]) -> str:
 
 
 _SIZE_TOKEN_SPLIT = re.compile(r"[^A-Z0-9]+")
+# Size token shapes, most specific first, preferred for Durin size hashtags.
+_PRIORITIZED_SIZE_TOKEN_PATTERNS = (
+    re.compile(r"^(?:\d+)?X{0,4}[SML]$"),
+    re.compile(r"^TU$"),
+    re.compile(r"^T[0-9]+$"),
+    re.compile(r"^\d{2,3}$"),
+)
 
 
 def _normalize_size_hashtag(value: Optional[str], *, default: str = "M") -> str:
@@ -99,14 +115,7 @@ def _normalize_size_hashtag(value: Optional[str], *, default: str = "M") -> str:
     normalized = normalized.replace("TAILLE", " ")
     tokens = [token for token in _SIZE_TOKEN_SPLIT.split(normalized) if token]
 
-    prioritized_patterns = (
-        re.compile(r"^(?:\d+)?X{0,4}[SML]$"),
-        re.compile(r"^TU$"),
-        re.compile(r"^T[0-9]+$"),
-        re.compile(r"^\d{2,3}$"),
-    )
-
-    for pattern in prioritized_patterns:
+    for pattern in _PRIORITIZED_SIZE_TOKEN_PATTERNS:
         for token in tokens:
             if pattern.match(token):
                 return token
@@ -118,13 +127,16 @@ def _normalize_size_hashtag(value: Optional[str], *, default: str = "M") -> str:
     return fallback or default
 
 
+_PARENTHESIZED_PATTERN = re.compile(r"\(([^)]+)\)")
+
+
 def _extract_primary_size_label(value: Optional[str]) -> Optional[str]:
     """Return the core size value (e.g. ``XL`` from ``FR 42 (XL)``)."""
 
     if not value:
         return None
 
-    match = re.search(r"\(([^)]+)\)", value)
+    match = _PARENTHESIZED_PATTERN.search(value)
     if match:
         return match.group(1).strip() or value.strip()
 
@@ -294,10 +306,13 @@ def _join_fibers(parts: List[str]) -> str:
     return f"{', '.join(parts[:-1])} et {parts[-1]}"
 
 
+_FIRST_NUMBER_PATTERN = re.compile(r"(\d+)")
+
+
 def _parse_fr_size_value(fr_size: Optional[str]) -> Optional[int]:
     if not fr_size:
         return None
-    match = re.search(r"(\d+)", str(fr_size))
+    match = _FIRST_NUMBER_PATTERN.search(str(fr_size))
     if not match:
         return None
     try:
@@ -414,7 +429,7 @@ def _estimate_price_for_jean_levis(
     return f"Estimation de prix indicative (critères : {criteria_display}) : {price}€"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ListingTemplate:
     name: str
     description: str
@@ -1033,10 +1048,13 @@ def _resolve_polaire_brand(fields: ListingFields) -> Tuple[str, str, str]:
     return fallback_display, fallback_hashtag, "polaire"
 
 
+_NON_ALNUM_LOWER_PATTERN = re.compile(r"[^a-z0-9]")
+
+
 def _find_pattern_rule(pattern_normalized: str) -> Optional[PatternRule]:
     if not pattern_normalized:
         return None
-    compact = re.sub(r"[^a-z0-9]", "", pattern_normalized)
+    compact = _NON_ALNUM_LOWER_PATTERN.sub("", pattern_normalized)
     for rule in PATTERN_RULES:
         for token in rule.tokens:
             if token in pattern_normalized or (compact and token in compact):
@@ -1855,156 +1873,163 @@ def render_template_polaire_outdoor(fields: ListingFields) -> Tuple[str, str]:
     return title, description
 
 
+@lru_cache(maxsize=None)
+def _build_default_templates() -> Dict[str, ListingTemplate]:
+    """Build the built-in templates once; registries share the result."""
+
+    return {
+        "template-jean-levis-femme": ListingTemplate(
+            name="template-jean-levis-femme",
+            description="Template Levi's femme",
+            prompt=dedent(
+                """
+                Prend en considération cette légende :
+                - Taille FR = taille française en cm, au format FR{{fr_size}}
+                - Modèle = code numérique du jean (ex: 501). Ajoute uniquement le mot "Premium" si et seulement si indiqué sur l'étiquette.
+                - Wn Ln = valeurs d’étiquette, {{w}} et {{l}}
+                - Coupe = {{fit_leg}} (insère la hauteur de taille {{rise_class}} dans la description uniquement, jamais dans le titre)
+                - Matière = {{cotton_pct}}% coton (+ {{polyester_pct}}% polyester si présent, + {{polyamide_pct}}% polyamide si présent, + {{elastane_pct}}% élasthanne si présent)
+                - Genre = {{gender}}  (valeurs attendues : femme, homme, mix)
+                - Commentaire (prioritaire) = informations utilisateur (taille, coupe, défauts, préférences) à appliquer en priorité dans l'estimation de prix, le titre et la description, même si elles ne sont pas visibles sur les photos {{defects}}
+                - SKU = {{sku}} (utilise JLF + numéro (1 à 3 chiffres) ;
+                  reprends exactement le numéro présent sur l’étiquette blanche visible sur le jean)
+
+                Utilise ce format :
+                TITRE
+                Jean Levi’s {{model}} FR{{fr_size}} W{{w}} L{{l}} coupe {{fit_leg}} {{cotton_pct}}% coton {{gender}} {{color_main}} - {{sku}}
+                
+                DESCRIPTION + HASHTAG
+                Jean Levi’s modèle {{model}} pour {{gender}}.
+                Taille {{w}} US (équivalent {{fr_size}} FR), coupe {{fit_leg}} à taille {{rise_class}}, pour une silhouette ajustée et confortable.
+                Coloris {{color_main}} légèrement délavé, très polyvalent et facile à assortir.
+                Composition : {{cotton_pct}}% coton{{#if polyester_pct}}, {{polyester_pct}}% polyester{{/if}}{{#if polyamide_pct}}, {{polyamide_pct}}% polyamide{{/if}}{{#if elastane_pct}}, {{elastane_pct}}% élasthanne{{/if}} pour une touche de stretch et plus de confort.
+                Fermeture zippée + bouton gravé Levi’s.
+                
+                Très bon état général {{defects}} (voir photos). S'il n'y a aucun défaut à signaler, écris simplement « Très bon état ».
+                📏 Mesures précises visibles en photo.
+                📦 Envoi rapide et soigné
+                
+                ✨ Retrouvez tous mes articles Levi’s à votre taille ici 👉 #durin31fr{{fr_size}}
+                💡 Pensez à faire un lot pour profiter d’une réduction supplémentaire et économiser des frais d’envoi !
+                
+                #levis #jeanlevis #levis{{gender}} #{{fit_leg}}jean #jeandenim #{{rise_class}} #jean{{color_main}} #vintedfr #durin31fr{{fr_size}}
+
+                Remplis les champs entre accolades en analysant les photos et en utilisant les commentaires.
+                """
+            ).strip(),
+            render_callback=render_template_jean_levis_femme,
+        ),
+        "template-pull-tommy-femme": ListingTemplate(
+            name="template-pull-tommy-femme",
+            description="Template Pull Tommy femme",
+            prompt=dedent(
+                """
+                Prend en considération cette légende :
+                - Taille = {{fr_size}} (taille visible sur l'étiquette, format XS/S/M/L/XL)
+                - Couleur = {{color_main}} (décris les couleurs principales visibles)
+                - Motif / maille = {{knit_pattern}} (marinière, torsadé, col V, etc.)
+                - Composition = {{cotton_pct}}, {{wool_pct}}, {{cashmere_pct}}, {{polyester_pct}}, {{polyamide_pct}}, {{viscose_pct}}, {{elastane_pct}} telles qu'indiquées sur l'étiquette
+                - Made in = {{made_in}} (copie exactement la mention écrite)
+                - Défauts = {{defects}} (détaille chaque imperfection visible)
+                - SKU = {{sku}} (utilise PTF + numéro (1 à 3 chiffres) lorsque l'étiquette blanche est lisible)
+                - {{matiere_principale}} = synthèse des matières dominantes (ex : 100% coton, laine torsadée, cachemire)
+                - {{made_in_europe}} = écris « Made in Europe » uniquement si l'étiquette indique un pays européen, sinon laisse vide
+                - Commentaire (prioritaire) = applique en priorité toute information saisie par l'utilisateur (taille, matière, défaut, coupe) pour remplir les champs, calculer l'estimation de prix et rédiger l'annonce, même si le détail n'est pas visible sur les photos
+
+                Règles :
+                - Pour le coton, si le pourcentage est inférieur à 60 %, écris simplement « coton ».
+                - Dans le titre, supprime les pourcentages de laine ou de cachemire lorsqu'ils sont faibles, mais dans la description et les champs ({{wool_pct}}/{{cashmere_pct}}) recopie la valeur numérique exacte indiquée dès que l'étiquette est lisible.
+                - Signale systématiquement lorsque les étiquettes taille/composition sont absentes ou illisibles.
+                - Mentionne « Made in Europe » uniquement si l'étiquette affiche un pays européen confirmé (France, Portugal, Italie, Espagne, etc.).
+                - Rappelle que les mesures sont visibles sur les photos pour plus de précision.
+
+                Utilise ce format :
+                TITRE
+                Pull Tommy Hilfiger femme taille {{fr_size}} {{matiere_principale}} {{color_main}} {{knit_pattern}} {{made_in_europe}} - {{sku}}
+
+                DESCRIPTION + HASHTAG
+                Pull Tommy Hilfiger pour femme taille {{fr_size}}.
+                Coloris {{color_main}} {{knit_pattern}}, parfait pour un look intemporel.
+                Composition : {{cotton_pct}}% coton{{#if wool_pct}}, laine{{/if}}{{#if cashmere_pct}}, cachemire{{/if}}{{#if polyester_pct}}, {{polyester_pct}}% polyester{{/if}}{{#if polyamide_pct}}, {{polyamide_pct}}% polyamide{{/if}}{{#if viscose_pct}}, {{viscose_pct}}% viscose{{/if}}{{#if elastane_pct}}, {{elastane_pct}}% élasthanne{{/if}} (adapte selon l'étiquette visible).
+                {{#if made_in}}Fabriqué en Europe {{made_in}} (uniquement si l'étiquette le confirme).{{/if}}
+                Très bon état {{defects}} (voir photos).
+                📏 Mesures détaillées visibles en photo.
+                📦 Envoi rapide et soigné
+
+                ✨ Retrouvez tous mes pulls Tommy femme ici 👉 #durin31tfM
+                💡 Pensez à faire un lot pour profiter d’une réduction supplémentaire et économiser des frais d’envoi !
+
+                #tommyhilfiger #pulltommy #pullfemme #modefemme #preloved #durin31tfM
+
+                Remplis les champs entre accolades en analysant les photos et en utilisant les commentaires.
+                """
+            ).strip(),
+            render_callback=render_template_pull_tommy_femme,
+        ),
+        "template-polaire-outdoor": ListingTemplate(
+            name="template-polaire-outdoor",
+            description="Template polaire outdoor (The North Face / Columbia)",
+            prompt=dedent(
+                """
+                Prend en considération cette légende :
+                - Marque = {{brand}} (The North Face ou Columbia, laisse vide si incertain)
+                - Modèle = {{model}} (nom exact ou référence)
+                - Taille = {{fr_size}} (XS/S/M/L/XL...), {{bust_flat_measurement_cm}}/{{length_measurement_cm}}/{{sleeve_measurement_cm}}/{{shoulder_measurement_cm}}/{{waist_flat_measurement_cm}}/{{hem_flat_measurement_cm}} en cm lorsque visibles
+                - Genre = {{gender}} (femme, homme, mix)
+                - Couleur principale = {{color_main}}
+                - Type de zip = {{zip_style}} (full zip, 1/4 zip, 1/2 zip, boutons…)
+                - Type de col / encolure = {{neckline_style}} (col roulé, col montant, col V, col rond, boutonné…)
+                - Logo ou détail distinctif = {{special_logo}} (ex : ruban rose pour la lutte contre le cancer du sein)
+                - Capuche = {{has_hood}} (true si la capuche est visible)
+                - Notes style/techniques = {{feature_notes}} / {{technical_features}} (Polartec, Omni-Heat, renforts, poches…)
+                - Composition = {{cotton_pct}}, {{wool_pct}}, {{cashmere_pct}}, {{polyester_pct}}, {{polyamide_pct}}, {{viscose_pct}}, {{elastane_pct}}, {{nylon_pct}}, {{acrylic_pct}}
+                - Made in = {{made_in}}
+                - Défauts = {{defects}} + {{defect_tags}}
+                - Visibilité des étiquettes = {{size_label_visible}}, {{fabric_label_visible}}, {{fabric_label_cut}}, {{non_size_labels_visible}}
+                - SKU = {{sku}} (PTNF + chiffres pour The North Face, PC + chiffres pour Columbia, n ∈ [1;999], sans tiret)
+
+                Règles :
+                - Le bloc Commentaire est prioritaire : si l'utilisateur indique taille, coupe, matière ou défaut, applique ces informations avant toute déduction des photos pour remplir les champs, calculer l'estimation et rédiger l'annonce.
+                - Les mensurations à plat sont obligatoires dès qu’une photo claire les affiche.
+                - Dans le titre, combine un maximum de détails : {{zip_style}} (full zip / 1/4 zip / boutons…) + {{neckline_style}} (col roulé / col montant / col V / col rond) et signale toute information {{special_logo}} visible (ex : ruban rose).
+                - Sauf commentaire explicite dans la boîte Commentaire mentionnant une autre fibre, considère les polaires comme 100% polyester quand l’étiquette n’est pas lisible : renseigne {{polyester_pct}} = "100" et laisse les autres champs matière vides.
+                - Ne mentionne la matière dans le titre que pour les fibres intéressantes (coton, laine, cachemire, soie) et jamais avec un pourcentage.
+                - Le SKU doit respecter exactement le format PTNF + chiffres ou PC + chiffres (pas de tiret) et ne jamais être inventé ; renvoie la chaîne vide si l’information manque.
+                - Signale toute étiquette coupée via {{fabric_label_cut}} et rappelle si les étiquettes taille/composition sont absentes.
+                - Ajoute un hashtag dédié aux tailles : #durin31f{{fr_size}} pour un modèle femme, #durin31h{{fr_size}} pour un modèle homme (majuscule), ou adapte pour une version mixte.
+
+                Utilise ce format :
+                TITRE
+                Polaire {{brand}} {{gender}} taille {{fr_size}} {{zip_style}} {{neckline_style}} {{special_logo}} {{color_main}} - {{sku}}
+
+                DESCRIPTION + HASHTAG
+                Polaire {{brand}} pour {{gender}}.
+                Taille {{fr_size}} (ou estimation via mesures). {{zip_style}} {{feature_notes}}.
+                {{technical_features}}
+                Composition : {{cotton_pct}}% coton{{#if wool_pct}}, laine{{/if}}{{#if cashmere_pct}}, cachemire{{/if}}{{#if polyester_pct}}, {{polyester_pct}}% polyester{{/if}}… (respecte exactement l’étiquette ou applique la règle 100% polyester par défaut).
+                Très bon état {{defects}} (voir photos). Mentionne les étiquettes coupées quand c’est le cas.
+                📏 Mesures détaillées visibles en photo.
+                📦 Envoi rapide et soigné
+
+                ✨ Retrouvez toutes mes polaires {{brand}} ici 👉 #durin31{{brand_short_code}}{{fr_size}}
+
+                👀 Filtrez toutes mes pièces {{gender}} taille {{fr_size}} (polaire, pull, jacket…) 👉 #durin31f{{fr_size}} ou #durin31h{{fr_size}} selon le genre
+
+                💡 Pensez à faire un lot pour profiter d’une réduction supplémentaire et économiser des frais d’envoi !
+
+                #thenorthface ou #columbia selon la marque + hashtags outdoor (max 10, inclure le hashtag taille #durin31f{{fr_size}} / #durin31h{{fr_size}}).
+                """
+            ).strip(),
+            render_callback=render_template_polaire_outdoor,
+        ),
+    }
+
+
 class ListingTemplateRegistry:
     """Registry holding available listing templates."""
 
     def __init__(self) -> None:
-        self._templates: Dict[str, ListingTemplate] = {
-            "template-jean-levis-femme": ListingTemplate(
-                name="template-jean-levis-femme",
-                description="Template Levi's femme",
-                prompt=dedent(
-                    """
-                    Prend en considération cette légende :
-                    - Taille FR = taille française en cm, au format FR{{fr_size}}
-                    - Modèle = code numérique du jean (ex: 501). Ajoute uniquement le mot "Premium" si et seulement si indiqué sur l'étiquette.
-                    - Wn Ln = valeurs d’étiquette, {{w}} et {{l}}
-                    - Coupe = {{fit_leg}} (insère la hauteur de taille {{rise_class}} dans la description uniquement, jamais dans le titre)
-                    - Matière = {{cotton_pct}}% coton (+ {{polyester_pct}}% polyester si présent, + {{polyamide_pct}}% polyamide si présent, + {{elastane_pct}}% élasthanne si présent)
-                    - Genre = {{gender}}  (valeurs attendues : femme, homme, mix)
-                    - Commentaire (prioritaire) = informations utilisateur (taille, coupe, défauts, préférences) à appliquer en priorité dans l'estimation de prix, le titre et la description, même si elles ne sont pas visibles sur les photos {{defects}}
-                    - SKU = {{sku}} (utilise JLF + numéro (1 à 3 chiffres) ;
-                      reprends exactement le numéro présent sur l’étiquette blanche visible sur le jean)
-
-                    Utilise ce format :
-                    TITRE
-                    Jean Levi’s {{model}} FR{{fr_size}} W{{w}} L{{l}} coupe {{fit_leg}} {{cotton_pct}}% coton {{gender}} {{color_main}} - {{sku}}
-                    
-                    DESCRIPTION + HASHTAG
-                    Jean Levi’s modèle {{model}} pour {{gender}}.
-                    Taille {{w}} US (équivalent {{fr_size}} FR), coupe {{fit_leg}} à taille {{rise_class}}, pour une silhouette ajustée et confortable.
-                    Coloris {{color_main}} légèrement délavé, très polyvalent et facile à assortir.
-                    Composition : {{cotton_pct}}% coton{{#if polyester_pct}}, {{polyester_pct}}% polyester{{/if}}{{#if polyamide_pct}}, {{polyamide_pct}}% polyamide{{/if}}{{#if elastane_pct}}, {{elastane_pct}}% élasthanne{{/if}} pour une touche de stretch et plus de confort.
-                    Fermeture zippée + bouton gravé Levi’s.
-                    
-                    Très bon état général {{defects}} (voir photos). S'il n'y a aucun défaut à signaler, écris simplement « Très bon état ».
-                    📏 Mesures précises visibles en photo.
-                    📦 Envoi rapide et soigné
-                    
-                    ✨ Retrouvez tous mes articles Levi’s à votre taille ici 👉 #durin31fr{{fr_size}}
-                    💡 Pensez à faire un lot pour profiter d’une réduction supplémentaire et économiser des frais d’envoi !
-                    
-                    #levis #jeanlevis #levis{{gender}} #{{fit_leg}}jean #jeandenim #{{rise_class}} #jean{{color_main}} #vintedfr #durin31fr{{fr_size}}
-
-                    Remplis les champs entre accolades en analysant les photos et en utilisant les commentaires.
-                    """
-                ).strip(),
-                render_callback=render_template_jean_levis_femme,
-            ),
-            "template-pull-tommy-femme": ListingTemplate(
-                name="template-pull-tommy-femme",
-                description="Template Pull Tommy femme",
-                prompt=dedent(
-                    """
-                    Prend en considération cette légende :
-                    - Taille = {{fr_size}} (taille visible sur l'étiquette, format XS/S/M/L/XL)
-                    - Couleur = {{color_main}} (décris les couleurs principales visibles)
-                    - Motif / maille = {{knit_pattern}} (marinière, torsadé, col V, etc.)
-                    - Composition = {{cotton_pct}}, {{wool_pct}}, {{cashmere_pct}}, {{polyester_pct}}, {{polyamide_pct}}, {{viscose_pct}}, {{elastane_pct}} telles qu'indiquées sur l'étiquette
-                    - Made in = {{made_in}} (copie exactement la mention écrite)
-                    - Défauts = {{defects}} (détaille chaque imperfection visible)
-                    - SKU = {{sku}} (utilise PTF + numéro (1 à 3 chiffres) lorsque l'étiquette blanche est lisible)
-                    - {{matiere_principale}} = synthèse des matières dominantes (ex : 100% coton, laine torsadée, cachemire)
-                    - {{made_in_europe}} = écris « Made in Europe » uniquement si l'étiquette indique un pays européen, sinon laisse vide
-                    - Commentaire (prioritaire) = applique en priorité toute information saisie par l'utilisateur (taille, matière, défaut, coupe) pour remplir les champs, calculer l'estimation de prix et rédiger l'annonce, même si le détail n'est pas visible sur les photos
-
-                    Règles :
-                    - Pour le coton, si le pourcentage est inférieur à 60 %, écris simplement « coton ».
-                    - Dans le titre, supprime les pourcentages de laine ou de cachemire lorsqu'ils sont faibles, mais dans la description et les champs ({{wool_pct}}/{{cashmere_pct}}) recopie la valeur numérique exacte indiquée dès que l'étiquette est lisible.
-                    - Signale systématiquement lorsque les étiquettes taille/composition sont absentes ou illisibles.
-                    - Mentionne « Made in Europe » uniquement si l'étiquette affiche un pays européen confirmé (France, Portugal, Italie, Espagne, etc.).
-                    - Rappelle que les mesures sont visibles sur les photos pour plus de précision.
-
-                    Utilise ce format :
-                    TITRE
-                    Pull Tommy Hilfiger femme taille {{fr_size}} {{matiere_principale}} {{color_main}} {{knit_pattern}} {{made_in_europe}} - {{sku}}
-
-                    DESCRIPTION + HASHTAG
-                    Pull Tommy Hilfiger pour femme taille {{fr_size}}.
-                    Coloris {{color_main}} {{knit_pattern}}, parfait pour un look intemporel.
-                    Composition : {{cotton_pct}}% coton{{#if wool_pct}}, laine{{/if}}{{#if cashmere_pct}}, cachemire{{/if}}{{#if polyester_pct}}, {{polyester_pct}}% polyester{{/if}}{{#if polyamide_pct}}, {{polyamide_pct}}% polyamide{{/if}}{{#if viscose_pct}}, {{viscose_pct}}% viscose{{/if}}{{#if elastane_pct}}, {{elastane_pct}}% élasthanne{{/if}} (adapte selon l'étiquette visible).
-                    {{#if made_in}}Fabriqué en Europe {{made_in}} (uniquement si l'étiquette le confirme).{{/if}}
-                    Très bon état {{defects}} (voir photos).
-                    📏 Mesures détaillées visibles en photo.
-                    📦 Envoi rapide et soigné
-
-                    ✨ Retrouvez tous mes pulls Tommy femme ici 👉 #durin31tfM
-                    💡 Pensez à faire un lot pour profiter d’une réduction supplémentaire et économiser des frais d’envoi !
-
-                    #tommyhilfiger #pulltommy #pullfemme #modefemme #preloved #durin31tfM
-
-                    Remplis les champs entre accolades en analysant les photos et en utilisant les commentaires.
-                    """
-                ).strip(),
-                render_callback=render_template_pull_tommy_femme,
-            ),
-            "template-polaire-outdoor": ListingTemplate(
-                name="template-polaire-outdoor",
-                description="Template polaire outdoor (The North Face / Columbia)",
-                prompt=dedent(
-                    """
-                    Prend en considération cette légende :
-                    - Marque = {{brand}} (The North Face ou Columbia, laisse vide si incertain)
-                    - Modèle = {{model}} (nom exact ou référence)
-                    - Taille = {{fr_size}} (XS/S/M/L/XL...), {{bust_flat_measurement_cm}}/{{length_measurement_cm}}/{{sleeve_measurement_cm}}/{{shoulder_measurement_cm}}/{{waist_flat_measurement_cm}}/{{hem_flat_measurement_cm}} en cm lorsque visibles
-                    - Genre = {{gender}} (femme, homme, mix)
-                    - Couleur principale = {{color_main}}
-                    - Type de zip = {{zip_style}} (full zip, 1/4 zip, 1/2 zip, boutons…)
-                    - Type de col / encolure = {{neckline_style}} (col roulé, col montant, col V, col rond, boutonné…)
-                    - Logo ou détail distinctif = {{special_logo}} (ex : ruban rose pour la lutte contre le cancer du sein)
-                    - Capuche = {{has_hood}} (true si la capuche est visible)
-                    - Notes style/techniques = {{feature_notes}} / {{technical_features}} (Polartec, Omni-Heat, renforts, poches…)
-                    - Composition = {{cotton_pct}}, {{wool_pct}}, {{cashmere_pct}}, {{polyester_pct}}, {{polyamide_pct}}, {{viscose_pct}}, {{elastane_pct}}, {{nylon_pct}}, {{acrylic_pct}}
-                    - Made in = {{made_in}}
-                    - Défauts = {{defects}} + {{defect_tags}}
-                    - Visibilité des étiquettes = {{size_label_visible}}, {{fabric_label_visible}}, {{fabric_label_cut}}, {{non_size_labels_visible}}
-                    - SKU = {{sku}} (PTNF + chiffres pour The North Face, PC + chiffres pour Columbia, n ∈ [1;999], sans tiret)
-
-                    Règles :
-                    - Le bloc Commentaire est prioritaire : si l'utilisateur indique taille, coupe, matière ou défaut, applique ces informations avant toute déduction des photos pour remplir les champs, calculer l'estimation et rédiger l'annonce.
-                    - Les mensurations à plat sont obligatoires dès qu’une photo claire les affiche.
-                    - Dans le titre, combine un maximum de détails : {{zip_style}} (full zip / 1/4 zip / boutons…) + {{neckline_style}} (col roulé / col montant / col V / col rond) et signale toute information {{special_logo}} visible (ex : ruban rose).
-                    - Sauf commentaire explicite dans la boîte Commentaire mentionnant une autre fibre, considère les polaires comme 100% polyester quand l’étiquette n’est pas lisible : renseigne {{polyester_pct}} = "100" et laisse les autres champs matière vides.
-                    - Ne mentionne la matière dans le titre que pour les fibres intéressantes (coton, laine, cachemire, soie) et jamais avec un pourcentage.
-                    - Le SKU doit respecter exactement le format PTNF + chiffres ou PC + chiffres (pas de tiret) et ne jamais être inventé ; renvoie la chaîne vide si l’information manque.
-                    - Signale toute étiquette coupée via {{fabric_label_cut}} et rappelle si les étiquettes taille/composition sont absentes.
-                    - Ajoute un hashtag dédié aux tailles : #durin31f{{fr_size}} pour un modèle femme, #durin31h{{fr_size}} pour un modèle homme (majuscule), ou adapte pour une version mixte.
-
-                    Utilise ce format :
-                    TITRE
-                    Polaire {{brand}} {{gender}} taille {{fr_size}} {{zip_style}} {{neckline_style}} {{special_logo}} {{color_main}} - {{sku}}
-
-                    DESCRIPTION + HASHTAG
-                    Polaire {{brand}} pour {{gender}}.
-                    Taille {{fr_size}} (ou estimation via mesures). {{zip_style}} {{feature_notes}}.
-                    {{technical_features}}
-                    Composition : {{cotton_pct}}% coton{{#if wool_pct}}, laine{{/if}}{{#if cashmere_pct}}, cachemire{{/if}}{{#if polyester_pct}}, {{polyester_pct}}% polyester{{/if}}… (respecte exactement l’étiquette ou applique la règle 100% polyester par défaut).
-                    Très bon état {{defects}} (voir photos). Mentionne les étiquettes coupées quand c’est le cas.
-                    📏 Mesures détaillées visibles en photo.
-                    📦 Envoi rapide et soigné
-
-                    ✨ Retrouvez toutes mes polaires {{brand}} ici 👉 #durin31{{brand_short_code}}{{fr_size}}
-
-                    👀 Filtrez toutes mes pièces {{gender}} taille {{fr_size}} (polaire, pull, jacket…) 👉 #durin31f{{fr_size}} ou #durin31h{{fr_size}} selon le genre
-
-                    💡 Pensez à faire un lot pour profiter d’une réduction supplémentaire et économiser des frais d’envoi !
-
-                    #thenorthface ou #columbia selon la marque + hashtags outdoor (max 10, inclure le hashtag taille #durin31f{{fr_size}} / #durin31h{{fr_size}}).
-                    """
-                ).strip(),
-                render_callback=render_template_polaire_outdoor,
-            ),
-        }
+        self._templates: Dict[str, ListingTemplate] = dict(_build_default_templates())
         self.default_template = "template-jean-levis-femme"
 
     @property
@@ -2,16 +2,10 @@
 from __future__ import annotations
 
 import json
-import sys
-from pathlib import Path
 from typing import Any, Dict, List
 
 import pytest
 
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
 from app.backend.gpt_client import ListingGenerator
 from app.backend.listing_fields import ListingFields
 from app.backend.templates import ListingTemplate
@@ -150,7 +144,7 @@ def _build_template_with_size_capture(captured: Dict[str, Any]) -> ListingTempla
     ],
 )
 def test_generate_listing_recovers_tommy_sku(
-    monkeypatch: pytest.MonkeyPatch, sku_reply: str, expected: str
+    monkeypatch: pytest.MonkeyPatch, sku_reply: str, expected: str, generator: ListingGenerator
 ) -> None:
     monkeypatch.setattr("app.backend.gpt_client.OpenAI", object)
     main_response = _listing_response(
@@ -159,7 +153,6 @@ def test_generate_listing_recovers_tommy_sku(
     recovery_response = FakeResponse(sku_reply)
     fake_client = FakeClient([main_response, recovery_response])
 
-    generator = ListingGenerator(model="fake", api_key="test")
     generator._client = fake_client  # type: ignore[assignment]
 
     captured: Dict[str, Any] = {}
@@ -179,6 +172,7 @@ def test_generate_listing_recovers_tommy_sku(
 
 def test_generate_listing_requests_manual_sku_when_recovery_fails(
     monkeypatch: pytest.MonkeyPatch,
+    generator: ListingGenerator,
 ) -> None:
     monkeypatch.setattr("app.backend.gpt_client.OpenAI", object)
     main_response = _listing_response(
@@ -187,7 +181,6 @@ def test_generate_listing_requests_manual_sku_when_recovery_fails(
     recovery_response = FakeResponse("")
     fake_client = FakeClient([main_response, recovery_response])
 
-    generator = ListingGenerator(model="fake", api_key="test")
     generator._client = fake_client  # type: ignore[assignment]
 
     captured: Dict[str, Any] = {}
@@ -206,13 +199,13 @@ def test_generate_listing_requests_manual_sku_when_recovery_fails(
 
 def test_generate_listing_discards_tommy_sku_without_visible_labels(
     monkeypatch: pytest.MonkeyPatch,
+    generator: ListingGenerator,
 ) -> None:
     monkeypatch.setattr("app.backend.gpt_client.OpenAI", object)
     payload = _base_fields_payload(sku="PTF99")
     main_response = _listing_response(payload)
     fake_client = FakeClient([main_response])
 
-    generator = ListingGenerator(model="fake", api_key="test")
     generator._client = fake_client  # type: ignore[assignment]
 
     captured: Dict[str, Any] = {}
@@ -230,13 +223,13 @@ def test_generate_listing_discards_tommy_sku_without_visible_labels(
 
 def test_generate_listing_neutralizes_invalid_tommy_sku(
     monkeypatch: pytest.MonkeyPatch,
+    generator: ListingGenerator,
 ) -> None:
     monkeypatch.setattr("app.backend.gpt_client.OpenAI", object)
     payload = _base_fields_payload(sku="PTF1234")
     main_response = _listing_response(payload)
     fake_client = FakeClient([main_response])
 
-    generator = ListingGenerator(model="fake", api_key="test")
     generator._client = fake_client  # type: ignore[assignment]
 
     captured: Dict[str, Any] = {}
@@ -276,13 +269,14 @@ def test_listing_fields_allows_missing_measurements_for_levis() -> None:
     assert fields.hem_flat_measurement_cm is None
 
 
-def test_comment_overrides_fr_size(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_comment_overrides_fr_size(
+    monkeypatch: pytest.MonkeyPatch, generator: ListingGenerator
+) -> None:
     monkeypatch.setattr("app.backend.gpt_client.OpenAI", object)
     payload = _base_fields_payload(fr_size="40", sku="PTF1")
     main_response = _listing_response(payload)
     fake_client = FakeClient([main_response])
 
-    generator = ListingGenerator(model="fake", api_key="test")
     generator._client = fake_client  # type: ignore[assignment]
 
     captured: Dict[str, Any] = {}
@@ -298,13 +292,14 @@ def test_comment_overrides_fr_size(monkeypatch: pytest.MonkeyPatch) -> None:
     assert fields.fr_size == "38"
 
 
-def test_comment_without_explicit_size_keeps_model_value(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_comment_without_explicit_size_keeps_model_value(
+    monkeypatch: pytest.MonkeyPatch, generator: ListingGenerator
+) -> None:
     monkeypatch.setattr("app.backend.gpt_client.OpenAI", object)
     payload = _base_fields_payload(fr_size="40", sku="PTF1", size_label_visible=True)
     main_response = _listing_response(payload)
     fake_client = FakeClient([main_response])
 
-    generator = ListingGenerator(model="fake", api_key="test")
     generator._client = fake_client  # type: ignore[assignment]
 
     captured: Dict[str, Any] = {}
@@ -322,13 +317,13 @@ def test_comment_without_explicit_size_keeps_model_value(monkeypatch: pytest.Mon
 
 def test_comment_with_defect_information_overrides_defects(
     monkeypatch: pytest.MonkeyPatch,
+    generator: ListingGenerator,
 ) -> None:
     monkeypatch.setattr("app.backend.gpt_client.OpenAI", object)
     payload = _base_fields_payload(defects="", sku="PTF1")
     main_response = _listing_response(payload)
     fake_client = FakeClient([main_response])
 
-    generator = ListingGenerator(model="fake", api_key="test")
     generator._client = fake_client  # type: ignore[assignment]
 
     captured: Dict[str, Any] = {}
@@ -342,7 +337,9 @@ def test_comment_with_defect_information_overrides_defects(
     assert fields.defects == comment
 
 
-def test_polaire_invalid_sku_fallbacks_to_empty(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_polaire_invalid_sku_fallbacks_to_empty(
+    monkeypatch: pytest.MonkeyPatch, generator: ListingGenerator
+) -> None:
     monkeypatch.setattr("app.backend.gpt_client.OpenAI", object)
     invalid_payload = _polaire_fields_payload(
         sku="PTNF42",
@@ -353,7 +350,6 @@ def test_polaire_invalid_sku_fallbacks_to_empty(monkeypatch: pytest.MonkeyPatch)
     main_response = _listing_response(invalid_payload)
     fake_client = FakeClient([main_response])
 
-    generator = ListingGenerator(model="fake", api_key="test")
     generator._client = fake_client  # type: ignore[assignment]
 
     captured: Dict[str, Any] = {}
@@ -383,7 +379,9 @@ def test_polaire_invalid_sku_fallbacks_to_empty(monkeypatch: pytest.MonkeyPatch)
     assert fields.sku == ""
 
 
-def test_manual_polaire_sku_used_in_title(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_manual_polaire_sku_used_in_title(
+    monkeypatch: pytest.MonkeyPatch, generator: ListingGenerator
+) -> None:
     monkeypatch.setattr("app.backend.gpt_client.OpenAI", object)
     payload = _polaire_fields_payload(
         sku="",
@@ -394,7 +392,6 @@ def test_manual_polaire_sku_used_in_title(monkeypatch: pytest.MonkeyPatch) -> No
     main_response = _listing_response(payload)
     fake_client = FakeClient([main_response])
 
-    generator = ListingGenerator(model="fake", api_key="test")
     generator._client = fake_client  # type: ignore[assignment]
 
     captured: Dict[str, Any] = {}
@@ -429,6 +426,7 @@ def test_manual_polaire_sku_used_in_title(monkeypatch: pytest.MonkeyPatch) -> No
 
 def test_manual_polaire_sku_without_digits_requests_user(
     monkeypatch: pytest.MonkeyPatch,
+    generator: ListingGenerator,
 ) -> None:
     monkeypatch.setattr("app.backend.gpt_client.OpenAI", object)
     payload = _polaire_fields_payload(
@@ -440,7 +438,6 @@ def test_manual_polaire_sku_without_digits_requests_user(
     main_response = _listing_response(payload)
     fake_client = FakeClient([main_response])
 
-    generator = ListingGenerator(model="fake", api_key="test")
     generator._client = fake_client  # type: ignore[assignment]
 
     captured: Dict[str, Any] = {}
@@ -1,439 +1,386 @@
 """Tests for listing templates rendering."""
 from __future__ import annotations
 
-import sys
 import json
-from dataclasses import asdict
-from pathlib import Path
-from typing import Any
+import re
+from dataclasses import fields as dataclass_fields, replace
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, NamedTuple
 
 import pytest
 
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
 from app.backend.gpt_client import ListingGenerator
 from app.backend.listing_fields import ListingFields
-from app.backend.templates import ListingTemplateRegistry
+from app.backend.templates import ListingTemplate
+from tests.helpers import FakeClient, occurs_once
+
 
+_TPL_POLAIRE = "template-polaire-outdoor"
 
 SIZE_LABEL_CUT_MESSAGE = "Étiquette de taille coupée pour plus de confort."
 COMPOSITION_LABEL_CUT_MESSAGE = "Étiquette de composition coupée pour plus de confort."
 COMBINED_LABEL_CUT_MESSAGE = "Étiquettes de taille et composition coupées pour plus de confort."
 COMBINED_LABEL_MISSING_MESSAGE = "Étiquettes de taille et composition non visibles sur les photos."
 
+_EXPECTED_BUST_L_FIRST_LINE = (
+    "Pull Tommy Hilfiger pour femme taille L (Taille estimée à la main à partir des mesures "
+    "à plat (voir photos). longueur épaule-ourlet ~50 cm)."
+)
+_EXPECTED_CIRCUMFERENCE_L_FIRST_LINE = (
+    "Pull Tommy Hilfiger pour femme taille L (Taille estimée à la main à partir des mesures "
+    "à plat (voir photos))."
+)
+
+# Whitespace-delimited tokens starting with "#", as ``str.split`` would yield them.
+_HASHTAG_RE = re.compile(r"(?<!\S)#\S*")
+
+
+def _shallow_asdict(obj: Any) -> dict[str, Any]:
+    """Return the dataclass fields of ``obj`` without ``asdict``'s deep copy."""
+
+    return {field.name: getattr(obj, field.name) for field in dataclass_fields(obj)}
+
+
+_DEFAULT_FIELDS = ListingFields(
+    model="",
+    fr_size="",
+    us_w="",
+    us_l="",
+    fit_leg="",
+    rise_class="",
+    rise_measurement_cm=None,
+    waist_measurement_cm=None,
+    cotton_pct="",
+    polyester_pct="",
+    polyamide_pct="",
+    viscose_pct="",
+    elastane_pct="",
+    gender="",
+    color_main="",
+    defects="",
+    defect_tags=(),
+    size_label_visible=True,
+    fabric_label_visible=True,
+    sku="",
+)
+
+
+def _fields_json(fields: ListingFields) -> str:
+    """Serialize ``fields`` as the model's ``{"fields": ...}`` JSON response."""
+
+    return json.dumps({"fields": _shallow_asdict(fields)})
+
+
+def _fields(**overrides: Any) -> ListingFields:
+    """Build ``ListingFields`` from empty defaults with visible labels."""
+
+    return replace(_DEFAULT_FIELDS, **overrides)
+
+
+@lru_cache(maxsize=128)
+def _render(template: ListingTemplate, fields: ListingFields) -> tuple[str, str, Any]:
+    """Render ``fields`` once per (template, fields) pair across this module."""
+
+    return template.render(fields)
+
+
+def _paragraph_lines(description: str) -> list[list[str]]:
+    """Split ``description`` into paragraphs, each as its list of lines."""
+
+    return [paragraph.split("\n") for paragraph in description.split("\n\n")]
+
 
-def test_render_defaults_to_femme_when_gender_missing_levis() -> None:
-    template = ListingTemplateRegistry().get_template("template-jean-levis-femme")
-    fields = ListingFields(
+def _hashtags(line: str) -> frozenset[str]:
+    """Return the hashtags of ``line`` as a set of whole tokens."""
+
+    return frozenset(_HASHTAG_RE.findall(line))
+
+
+def test_render_defaults_to_femme_when_gender_missing_levis(
+    jean_levis_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(
         model="501",
         fr_size="38",
         us_w="28",
         us_l="30",
         fit_leg="slim",
         rise_class="haute",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
         cotton_pct="99",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
         elastane_pct="1",
-        gender="",
         color_main="bleu",
-        defects="",
-        defect_tags=(),
-        size_label_visible=True,
-        fabric_label_visible=True,
         sku="JLF1",
     )
 
-    title, description, _ = template.render(fields)
+    title, description, _ = _render(jean_levis_femme_template, fields)
 
     assert "femme" in title.lower()
     assert "femme" in description.lower()
     assert "#levisfemme" in description.lower()
 
 
-def test_render_jean_levis_femme_uses_sku_placeholder_when_missing() -> None:
-    template = ListingTemplateRegistry().get_template("template-jean-levis-femme")
-    fields = ListingFields(
+def test_render_jean_levis_femme_uses_sku_placeholder_when_missing(
+    jean_levis_femme_template: ListingTemplate,
+    generator: ListingGenerator,
+) -> None:
+    fields = _fields(
         model="501",
         fr_size="38",
-        us_w="",
-        us_l="",
         fit_leg="straight",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
         cotton_pct="98",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
         gender="Femme",
         color_main="bleu",
-        defects="",
-        defect_tags=(),
         size_label_visible=False,
         fabric_label_visible=False,
-        sku="",
     )
 
-    _title, description, _ = template.render(fields)
+    _title, description, _ = _render(jean_levis_femme_template, fields)
 
     assert "sku" not in description.lower()
 
-    generator = ListingGenerator()
-    payload = {"fields": asdict(fields)}
-
-    class _FakeResponse:
-        def __init__(self, text: str) -> None:
-            self.output_text = text
-
-    class _FakeResponses:
-        def __init__(self, text: str) -> None:
-            self._text = text
-
-        def create(self, **_kwargs: object) -> _FakeResponse:
-            return _FakeResponse(self._text)
-
-    class _FakeClient:
-        def __init__(self, text: str) -> None:
-            self.responses = _FakeResponses(text)
-
-    generator._client = _FakeClient(json.dumps(payload))  # type: ignore[attr-defined]
-    result = generator.generate_listing([], "", template, "")
+    generator._client = FakeClient(_fields_json(fields))  # type: ignore[attr-defined]
+    result = generator.generate_listing([], "", jean_levis_femme_template, "")
 
     assert result.sku_missing is True
 
 
-def test_render_jean_levis_handles_fabric_label_cut() -> None:
-    template = ListingTemplateRegistry().get_template("template-jean-levis-femme")
-    fields = ListingFields(
+def test_render_jean_levis_handles_fabric_label_cut(
+    jean_levis_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(
         model="505",
         fr_size="40",
         us_w="30",
         us_l="32",
         fit_leg="straight",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
-        cotton_pct="",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
         gender="Femme",
         color_main="bleu",
-        defects="",
-        defect_tags=(),
-        size_label_visible=True,
         fabric_label_visible=False,
         fabric_label_cut=True,
         sku="JLF20",
     )
 
-    _, description, _ = template.render(fields)
+    _, description, _ = _render(jean_levis_femme_template, fields)
 
-    assert description.count(COMPOSITION_LABEL_CUT_MESSAGE) == 1
+    assert occurs_once(description, COMPOSITION_LABEL_CUT_MESSAGE)
 
 
-def test_render_jean_levis_prefers_user_sizes_when_label_visible() -> None:
-    template = ListingTemplateRegistry().get_template("template-jean-levis-femme")
-    fields = ListingFields(
+def test_render_jean_levis_prefers_user_sizes_when_label_visible(
+    jean_levis_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(
         model="501",
         fr_size="38",
         us_w="28",
         us_l="30",
         fit_leg="straight",
-        rise_class="",
-        rise_measurement_cm=None,
         waist_measurement_cm=90.0,
         cotton_pct="99",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
         elastane_pct="1",
         gender="Femme",
         color_main="bleu",
-        defects="",
-        defect_tags=(),
-        size_label_visible=True,
-        fabric_label_visible=True,
         sku="JLF-SIZE",
     )
 
-    title, description, _ = template.render(fields)
+    title, description, _ = _render(jean_levis_femme_template, fields)
 
     assert "FR38" in title
     assert "W28" in title
 
-    first_paragraph = description.split("\n\n")[0]
+    paragraphs = description.split("\n\n")
+    first_paragraph = paragraphs[0]
     assert "28 US" in first_paragraph
     assert "38 FR" in first_paragraph
 
-    hashtags_line = description.split("\n\n")[-1].lower()
+    hashtags_line = paragraphs[-1].lower()
     assert "#w28" in hashtags_line
     assert "#fr38" in hashtags_line
 
 
-def test_render_jean_levis_marks_estimated_size_without_forbidden_note() -> None:
-    template = ListingTemplateRegistry().get_template("template-jean-levis-femme")
-    fields = ListingFields(
-        model="",  # no explicit context
-        fr_size="",
-        us_w="",
-        us_l="",
+def test_render_jean_levis_marks_estimated_size_without_forbidden_note(
+    jean_levis_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(
         fit_leg="straight",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
-        cotton_pct="",  # composition irrelevant here
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
         gender="Femme",
-        color_main="",
-        defects="",
-        defect_tags=(),
         size_label_visible=False,
         fabric_label_visible=False,
-        fabric_label_cut=False,
         sku="JLF22",
         waist_flat_measurement_cm=41.2,
     )
 
-    title, description, _ = template.render(fields)
+    title, description, _ = _render(jean_levis_femme_template, fields)
 
     assert "(voir photos)" in description
     assert "Taille estimée à partir" not in title
     assert "Taille estimée à partir" not in description
 
 
-def test_render_jean_levis_estimates_price_with_visible_stains() -> None:
-    template = ListingTemplateRegistry().get_template("template-jean-levis-femme")
-    fields = ListingFields(
+def test_render_jean_levis_estimates_price_with_visible_stains(
+    jean_levis_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(
         model="501",
         fr_size="38",
         us_w="28",
         us_l="32",
         fit_leg="straight",
         rise_class="regular",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
         cotton_pct="100",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
         gender="Femme",
         color_main="bleu",
         defects="Tâches visibles sur l'avant",
-        defect_tags=(),
-        size_label_visible=True,
-        fabric_label_visible=True,
-        fabric_label_cut=False,
         sku="JLF99",
     )
 
-    _, _, price_estimate = template.render(fields)
+    _, _, price_estimate = _render(jean_levis_femme_template, fields)
 
     assert price_estimate is not None
     assert price_estimate.endswith("17€")
 
 
-def test_render_jean_levis_estimates_price_white_with_stains() -> None:
-    template = ListingTemplateRegistry().get_template("template-jean-levis-femme")
-    fields = ListingFields(
+def test_render_jean_levis_estimates_price_white_with_stains(
+    jean_levis_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(
         model="501",
         fr_size="38",
         us_w="28",
         us_l="32",
         fit_leg="straight",
         rise_class="regular",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
         cotton_pct="100",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
         gender="Femme",
         color_main="blanc",
         defects="Micro tache sur l'avant",
-        defect_tags=(),
-        size_label_visible=True,
-        fabric_label_visible=True,
-        fabric_label_cut=False,
         sku="JLF100",
     )
 
-    _, _, price_estimate = template.render(fields)
+    _, _, price_estimate = _render(jean_levis_femme_template, fields)
 
     assert price_estimate is not None
     assert price_estimate.endswith("12€")
 
 
-def test_render_jean_levis_estimates_price_size_50_no_stain() -> None:
-    template = ListingTemplateRegistry().get_template("template-jean-levis-femme")
-    fields = ListingFields(
+def test_render_jean_levis_estimates_price_size_50_no_stain(
+    jean_levis_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(
         model="501",
         fr_size="50",
-        us_w="",  # irrelevant here
-        us_l="",
         fit_leg="straight",
         rise_class="regular",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
-        cotton_pct="",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
         gender="Femme",
         color_main="bleu",
-        defects="",
-        defect_tags=(),
-        size_label_visible=True,
         fabric_label_visible=False,
-        fabric_label_cut=False,
         sku="JLF101",
     )
 
-    _, _, price_estimate = template.render(fields)
+    _, _, price_estimate = _render(jean_levis_femme_template, fields)
 
     assert price_estimate is not None
     assert price_estimate.endswith("24€")
 
 
-def test_render_jean_levis_estimates_price_premium_size_46_with_stain() -> None:
-    template = ListingTemplateRegistry().get_template("template-jean-levis-femme")
-    fields = ListingFields(
+def test_render_jean_levis_estimates_price_premium_size_46_with_stain(
+    jean_levis_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(
         model="501 Premium",
         fr_size="46",
-        us_w="",  # irrelevant here
-        us_l="",
         fit_leg="straight",
         rise_class="regular",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
-        cotton_pct="",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
         gender="Femme",
         color_main="bleu",
         defects="Petite tache sur l'ourlet",
-        defect_tags=(),
-        size_label_visible=True,
         fabric_label_visible=False,
-        fabric_label_cut=False,
         sku="JLF102",
     )
 
-    _, _, price_estimate = template.render(fields)
+    _, _, price_estimate = _render(jean_levis_femme_template, fields)
 
     assert price_estimate is not None
     assert price_estimate.endswith("21€")
 
 
-def test_render_jean_levis_estimates_price_premium_white_stain() -> None:
-    template = ListingTemplateRegistry().get_template("template-jean-levis-femme")
-    fields = ListingFields(
+def test_render_jean_levis_estimates_price_premium_white_stain(
+    jean_levis_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(
         model="Levi's Premium",
         fr_size="38",
-        us_w="",
-        us_l="",
         fit_leg="straight",
         rise_class="regular",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
-        cotton_pct="",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
         gender="Femme",
         color_main="blanc",
         defects="Tâche visible sur le genou",
-        defect_tags=(),
-        size_label_visible=True,
         fabric_label_visible=False,
-        fabric_label_cut=False,
         sku="JLF103",
     )
 
-    _, _, price_estimate = template.render(fields)
+    _, _, price_estimate = _render(jean_levis_femme_template, fields)
 
     assert price_estimate is not None
     assert price_estimate.endswith("14€")
 
 
-def test_render_jean_levis_fabric_label_missing_no_duplicate_messages() -> None:
-    template = ListingTemplateRegistry().get_template("template-jean-levis-femme")
-    fields = ListingFields(
-        model="",  # minimal context
-        fr_size="38",
-        us_w="28",
-        us_l="",
-        fit_leg="slim",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
-        cotton_pct="",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="Femme",
-        color_main="",
-        defects="",
-        defect_tags=(),
-        size_label_visible=True,
-        fabric_label_visible=False,
-        fabric_label_cut=False,
-        sku="JLF23",
-    )
-
-    _, description, _ = template.render(fields)
-
-    assert description.count(COMPOSITION_LABEL_CUT_MESSAGE) == 1
-    assert SIZE_LABEL_CUT_MESSAGE not in description
-    assert COMBINED_LABEL_CUT_MESSAGE not in description
+@pytest.mark.parametrize(
+    "overrides, expected_once, absent",
+    [
+        pytest.param(
+            {
+                "fr_size": "38",
+                "us_w": "28",
+                "fit_leg": "slim",
+                "gender": "Femme",
+                "fabric_label_visible": False,
+                "sku": "JLF23",
+            },
+            COMPOSITION_LABEL_CUT_MESSAGE,
+            (SIZE_LABEL_CUT_MESSAGE, COMBINED_LABEL_CUT_MESSAGE),
+            id="fabric-label-missing",
+        ),
+        pytest.param(
+            {"size_label_visible": False, "fabric_label_visible": False, "sku": "JLF21"},
+            COMBINED_LABEL_CUT_MESSAGE,
+            (COMPOSITION_LABEL_CUT_MESSAGE, SIZE_LABEL_CUT_MESSAGE),
+            id="all-labels-missing",
+        ),
+    ],
+)
+def test_render_jean_levis_label_messages_are_not_duplicated(
+    overrides: dict[str, Any],
+    expected_once: str,
+    absent: tuple[str, ...],
+    jean_levis_femme_template: ListingTemplate,
+) -> None:
+    _, description, _ = _render(jean_levis_femme_template, _fields(**overrides))
 
+    assert occurs_once(description, expected_once)
+    for message in absent:
+        assert message not in description, message
 
-def test_render_jean_levis_stretch_mentions_threshold() -> None:
-    template = ListingTemplateRegistry().get_template("template-jean-levis-femme")
 
+def test_render_jean_levis_stretch_mentions_threshold(
+    jean_levis_femme_template: ListingTemplate,
+) -> None:
     def render_with_elastane(elastane_pct: str) -> tuple[str, str, str]:
-        return template.render(
-            ListingFields(
+        return _render(
+            jean_levis_femme_template,
+            _fields(
                 model="501",
                 fr_size="38",
                 us_w="28",
                 us_l="30",
                 fit_leg="slim",
                 rise_class="regular",
-                rise_measurement_cm=None,
-                waist_measurement_cm=None,
                 cotton_pct="98",
-                polyester_pct="",
-                polyamide_pct="",
-                viscose_pct="",
                 elastane_pct=elastane_pct,
                 gender="Femme",
                 color_main="bleu",
-                defects="",
-                defect_tags=(),
-                size_label_visible=True,
-                fabric_label_visible=True,
-                fabric_label_cut=False,
                 sku="JLF201",
-            )
+            ),
         )
 
     title_low, description_low, _ = render_with_elastane("2")
@@ -441,80 +388,28 @@ def test_render_jean_levis_stretch_mentions_threshold() -> None:
 
     assert "stretch" not in title_low.lower()
     assert "stretch" not in description_low.lower()
-    low_hashtags = [
-        token for token in description_low.splitlines()[-1].split() if token.startswith("#")
-    ]
+    low_hashtags = _HASHTAG_RE.findall(description_low.rpartition("\n")[2])
     assert "#stretch" not in {token.lower() for token in low_hashtags}
 
     assert "stretch" in title_high.lower()
     assert "stretch" in description_high.lower()
-    high_hashtags = [
-        token for token in description_high.splitlines()[-1].split() if token.startswith("#")
-    ]
+    high_hashtags = _HASHTAG_RE.findall(description_high.rpartition("\n")[2])
     assert "#stretch" in {token.lower() for token in high_hashtags}
 
 
-def test_render_jean_levis_avoids_duplicate_missing_fabric_label_sentence() -> None:
-    template = ListingTemplateRegistry().get_template("template-jean-levis-femme")
-    fields = ListingFields(
-        model="",
-        fr_size="",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
-        cotton_pct="",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="",
-        color_main="",
-        defects="",
-        defect_tags=(),
-        size_label_visible=False,
-        fabric_label_visible=False,
-        fabric_label_cut=False,
-        sku="JLF21",
-    )
-
-    _, description, _ = template.render(fields)
-
-    assert description.count(COMBINED_LABEL_CUT_MESSAGE) == 1
-    assert COMPOSITION_LABEL_CUT_MESSAGE not in description
-    assert SIZE_LABEL_CUT_MESSAGE not in description
-
-
-def test_render_pull_tommy_femme_includes_made_in_europe_and_hashtags() -> None:
-    template = ListingTemplateRegistry().get_template("template-pull-tommy-femme")
-    fields = ListingFields(
-        model="",
+def test_render_pull_tommy_femme_includes_made_in_europe_and_hashtags(
+    pull_tommy_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(
         fr_size="M",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
         cotton_pct="100",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="",
         color_main="blanc et noir",
-        defects="",
-        defect_tags=(),
-        size_label_visible=True,
-        fabric_label_visible=True,
         sku="PTF01",
         knit_pattern="marinière",
         made_in="Made in Portugal",
     )
 
-    title, description, _ = template.render(fields)
+    title, description, _ = _render(pull_tommy_femme_template, fields)
 
     assert "Pull Tommy Hilfiger femme" in title
     assert "100% coton" in title
@@ -528,36 +423,21 @@ def test_render_pull_tommy_femme_includes_made_in_europe_and_hashtags() -> None:
     assert "Mesures détaillées visibles en photo" in description
     assert "Référence SKU" not in description
 
-    hashtags_line = description.splitlines()[-1]
-    hashtags = [token for token in hashtags_line.split() if token.startswith("#")]
+    hashtags_line = description.rpartition("\n")[2]
+    hashtags = _HASHTAG_RE.findall(hashtags_line)
     assert "#durin31tfM" in hashtags
     assert len(hashtags) == len(set(hashtags))
     assert len(hashtags) >= 10
 
 
-def test_render_pull_tommy_femme_estimates_size_from_bust_measurement() -> None:
-    template = ListingTemplateRegistry().get_template("template-pull-tommy-femme")
-    fields = ListingFields(
-        model="",
-        fr_size="",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
+def test_render_pull_tommy_femme_estimates_size_from_bust_measurement(
+    pull_tommy_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(
         cotton_pct="100",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="",
         color_main="bleu marine",
-        defects="",
-        defect_tags=(),
         size_label_visible=False,
         fabric_label_visible=False,
-        sku="",
         knit_pattern="",
         made_in="",
         bust_flat_measurement_cm=48.0,
@@ -568,136 +448,78 @@ def test_render_pull_tommy_femme_estimates_size_from_bust_measurement() -> None:
         hem_flat_measurement_cm=47.0,
     )
 
-    title, description, _ = template.render(fields)
+    title, description, _ = _render(pull_tommy_femme_template, fields)
 
     assert "taille L" in title
     assert "estimée" not in title
 
-    first_paragraph_lines = description.split("\n\n")[0].split("\n")
-    assert first_paragraph_lines[0] == (
-        "Pull Tommy Hilfiger pour femme taille L (Taille estimée à la main à partir des mesures à plat (voir photos). longueur épaule-ourlet ~50 cm)."
-    )
+    assert description.partition("\n")[0] == _EXPECTED_BUST_L_FIRST_LINE
     assert "Coupe courte" not in description
     assert "Manches mesurées" not in description
 
-    assert description.count(COMBINED_LABEL_CUT_MESSAGE) == 1
+    assert occurs_once(description, COMBINED_LABEL_CUT_MESSAGE)
     assert "Mesures à plat disponibles" not in description
     assert "#durin31tfL" in description
 
 
-def test_render_pull_tommy_femme_estimates_size_from_full_circumference() -> None:
-    template = ListingTemplateRegistry().get_template("template-pull-tommy-femme")
-    fields = ListingFields(
-        model="",
-        fr_size="",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
+def test_render_pull_tommy_femme_estimates_size_from_full_circumference(
+    pull_tommy_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(
         cotton_pct="100",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="",
         color_main="bleu marine",
-        defects="",
-        defect_tags=(),
         size_label_visible=False,
         fabric_label_visible=False,
-        sku="",
         knit_pattern="",
         made_in="",
         bust_flat_measurement_cm=96.0,
-        length_measurement_cm=None,
-        sleeve_measurement_cm=None,
-        shoulder_measurement_cm=None,
-        waist_flat_measurement_cm=None,
-        hem_flat_measurement_cm=None,
     )
 
-    title, description, _ = template.render(fields)
+    title, description, _ = _render(pull_tommy_femme_template, fields)
 
     assert "taille L" in title
 
-    first_sentence = description.split("\n\n")[0].split("\n")[0]
-    assert first_sentence == (
-        "Pull Tommy Hilfiger pour femme taille L (Taille estimée à la main à partir des mesures à plat (voir photos))."
-    )
+    assert description.partition("\n")[0] == _EXPECTED_CIRCUMFERENCE_L_FIRST_LINE
 
-    hashtags_line = description.splitlines()[-1]
-    hashtags = [token for token in hashtags_line.split() if token.startswith("#")]
+    hashtags_line = description.rpartition("\n")[2]
+    hashtags = _HASHTAG_RE.findall(hashtags_line)
     assert "#durin31tfL" in hashtags
 
 
-def test_render_pull_tommy_femme_splits_neckline_from_pattern() -> None:
-    template = ListingTemplateRegistry().get_template("template-pull-tommy-femme")
-    fields = ListingFields(
-        model="",
+def test_render_pull_tommy_femme_splits_neckline_from_pattern(
+    pull_tommy_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(
         fr_size="M",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
         cotton_pct="60",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="",
         color_main="bleu marine",
-        defects="",
-        defect_tags=(),
-        size_label_visible=True,
-        fabric_label_visible=True,
         sku="PTF02",
         knit_pattern="Marinière col V",
     )
 
-    title, description, _ = template.render(fields)
+    title, description, _ = _render(pull_tommy_femme_template, fields)
 
     assert title.startswith("Pull Tommy Hilfiger femme taille M")
     assert title.split(" - ")[0].endswith("col V")
 
-    first_paragraph_lines = description.split("\n\n")[0].split("\n")
-    assert first_paragraph_lines[1] == (
+    paragraphs = _paragraph_lines(description)
+    assert paragraphs[0][1] == (
         "Motif marinière sur un coloris bleu marine facile à associer. "
         "Col V qui structure joliment l'encolure."
     )
-
-    highlight_line = description.split("\n\n")[1].split("\n")[0]
-    assert highlight_line == (
+    assert paragraphs[1][0] == (
         "Maille composée de 60% coton pour une sensation douce et respirante. "
         "L'esprit marinière signe une allure marine iconique. Col V pour une jolie finition."
     )
 
 
-def test_render_pull_tommy_femme_omits_irrelevant_bust_measurement() -> None:
-    template = ListingTemplateRegistry().get_template("template-pull-tommy-femme")
-    fields = ListingFields(
-        model="",
+def test_render_pull_tommy_femme_omits_irrelevant_bust_measurement(
+    pull_tommy_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(
         fr_size="M",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
         cotton_pct="100",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="",
         color_main="bleu marine",
-        defects="",
-        defect_tags=(),
-        size_label_visible=True,
-        fabric_label_visible=True,
         sku="PTF03",
         knit_pattern="",
         bust_flat_measurement_cm=47.0,
@@ -708,289 +530,158 @@ def test_render_pull_tommy_femme_omits_irrelevant_bust_measurement() -> None:
         hem_flat_measurement_cm=46.0,
     )
 
-    _, description, _ = template.render(fields)
+    _, description, _ = _render(pull_tommy_femme_template, fields)
 
-    first_line = description.split("\n\n")[0].split("\n")[0]
+    paragraphs = description.split("\n\n")
+    first_line = paragraphs[0].partition("\n")[0]
     assert "poitrine" not in first_line.lower()
 
-    measurement_section = description.split("\n\n")[2]
+    measurement_section = paragraphs[2]
     assert "Poitrine" not in measurement_section
 
 
-def test_render_pull_tommy_femme_handles_fabric_label_cut() -> None:
-    template = ListingTemplateRegistry().get_template("template-pull-tommy-femme")
-    fields = ListingFields(
-        model="",
-        fr_size="M",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
-        cotton_pct="",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="",
-        color_main="bleu",
-        defects="",
-        defect_tags=(),
-        size_label_visible=False,
-        fabric_label_visible=False,
-        fabric_label_cut=True,
-        sku="PTF99",
-    )
-
-    _, description, _ = template.render(fields)
-
-    assert description.count(COMBINED_LABEL_CUT_MESSAGE) == 1
-    assert "Référence SKU" not in description
-
-
-def test_render_pull_tommy_femme_skips_cut_sentence_when_other_labels_visible() -> None:
-    template = ListingTemplateRegistry().get_template("template-pull-tommy-femme")
-    fields = ListingFields(
-        model="",
-        fr_size="M",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
-        cotton_pct="",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="",
-        color_main="bleu",
-        defects="",
-        defect_tags=(),
-        size_label_visible=False,
-        fabric_label_visible=False,
-        fabric_label_cut=True,
-        non_size_labels_visible=True,
-        sku="PTF97",
-    )
-
-    _, description, _ = template.render(fields)
-
-    assert description.count(COMBINED_LABEL_CUT_MESSAGE) == 1
-    assert "Composition non lisible sur l'étiquette (voir photos pour confirmation)." not in description
-
-
-def test_render_pull_tommy_femme_handles_hidden_fabric_label() -> None:
-    template = ListingTemplateRegistry().get_template("template-pull-tommy-femme")
-
-    fields = ListingFields(
-        model="",
-        fr_size="M",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
-        cotton_pct="",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="",
-        color_main="bleu",
-        defects="",
-        defect_tags=(),
-        size_label_visible=True,
-        fabric_label_visible=False,
-        fabric_label_cut=False,
-        sku="PTF98",
-    )
+@pytest.mark.parametrize(
+    "overrides, expected_once, absent",
+    [
+        pytest.param(
+            {
+                "size_label_visible": False,
+                "fabric_label_visible": False,
+                "fabric_label_cut": True,
+                "sku": "PTF99",
+            },
+            COMBINED_LABEL_CUT_MESSAGE,
+            ("Référence SKU",),
+            id="labels-cut",
+        ),
+        pytest.param(
+            {
+                "size_label_visible": False,
+                "fabric_label_visible": False,
+                "fabric_label_cut": True,
+                "non_size_labels_visible": True,
+                "sku": "PTF97",
+            },
+            COMBINED_LABEL_CUT_MESSAGE,
+            ("Composition non lisible sur l'étiquette (voir photos pour confirmation).",),
+            id="labels-cut-other-labels-visible",
+        ),
+        pytest.param(
+            {"fabric_label_visible": False, "sku": "PTF98"},
+            COMPOSITION_LABEL_CUT_MESSAGE,
+            (COMBINED_LABEL_CUT_MESSAGE, SIZE_LABEL_CUT_MESSAGE, "Référence SKU"),
+            id="fabric-label-hidden",
+        ),
+    ],
+)
+def test_render_pull_tommy_femme_label_messages(
+    overrides: dict[str, Any],
+    expected_once: str,
+    absent: tuple[str, ...],
+    pull_tommy_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(fr_size="M", color_main="bleu", **overrides)
 
-    _, description, _ = template.render(fields)
+    _, description, _ = _render(pull_tommy_femme_template, fields)
 
-    assert description.count(COMPOSITION_LABEL_CUT_MESSAGE) == 1
-    assert COMBINED_LABEL_CUT_MESSAGE not in description
-    assert SIZE_LABEL_CUT_MESSAGE not in description
-    assert "Référence SKU" not in description
+    assert occurs_once(description, expected_once)
+    for fragment in absent:
+        assert fragment not in description, fragment
 
 
-def test_render_jean_levis_includes_polyamide_when_present() -> None:
-    template = ListingTemplateRegistry().get_template("template-jean-levis-femme")
-    fields = ListingFields(
+def test_render_jean_levis_includes_polyamide_when_present(
+    jean_levis_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(
         model="721",
         fr_size="38",
         us_w="28",
         us_l="30",
         fit_leg="slim",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
         cotton_pct="70",
-        polyester_pct="",
         polyamide_pct="12",
-        viscose_pct="",
         elastane_pct="2",
         gender="Femme",
         color_main="bleu",
-        defects="",
-        defect_tags=(),
-        size_label_visible=True,
-        fabric_label_visible=True,
         sku="JLF9",
     )
 
-    _, description, _ = template.render(fields)
+    _, description, _ = _render(jean_levis_femme_template, fields)
 
     assert "12% polyamide" in description
 
 
-def test_render_pull_tommy_femme_switches_to_cardigan() -> None:
-    template = ListingTemplateRegistry().get_template("template-pull-tommy-femme")
-
-    fields = ListingFields(
-        model="",
+def test_render_pull_tommy_femme_switches_to_cardigan(
+    pull_tommy_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(
         fr_size="S",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
         cotton_pct="80",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="",
         color_main="beige",
         knit_pattern="torsadé",
-        defects="",
-        defect_tags=(),
-        size_label_visible=True,
-        fabric_label_visible=True,
         sku="PTF55",
         is_cardigan=True,
     )
 
-    title, description, _ = template.render(fields)
+    title, description, _ = _render(pull_tommy_femme_template, fields)
 
     assert title.startswith("Gilet Tommy Hilfiger femme")
     assert description.splitlines()[0].startswith("Gilet Tommy Hilfiger")
-    hashtags_line = description.splitlines()[-1]
+    hashtags_line = description.rpartition("\n")[2]
     assert "#gilettommy" in hashtags_line
     assert "#pulltommy" not in hashtags_line
 
 
-def test_render_pull_tommy_femme_handles_dress() -> None:
-    template = ListingTemplateRegistry().get_template("template-pull-tommy-femme")
-
-    fields = ListingFields(
-        model="",
+def test_render_pull_tommy_femme_handles_dress(pull_tommy_femme_template: ListingTemplate) -> None:
+    fields = _fields(
         fr_size="M",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
         cotton_pct="70",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="",
         color_main="rouge",
         knit_pattern="",
-        defects="",
-        defect_tags=(),
-        size_label_visible=True,
-        fabric_label_visible=True,
         sku="PTF77",
         is_dress=True,
     )
 
-    title, description, _ = template.render(fields)
+    title, description, _ = _render(pull_tommy_femme_template, fields)
 
     assert title.startswith("Robe Tommy Hilfiger femme")
-    first_paragraph_lines = description.split("\n\n")[0].split("\n")
-    assert first_paragraph_lines[0] == "Robe Tommy Hilfiger pour femme taille M."
+    paragraphs = _paragraph_lines(description)
+    assert paragraphs[0][0] == "Robe Tommy Hilfiger pour femme taille M."
+    assert any("mes robes Tommy femme" in line for line in paragraphs[3])
 
-    fourth_paragraph = description.split("\n\n")[3]
-    assert "mes robes Tommy femme" in fourth_paragraph
-
-    hashtags_line = description.splitlines()[-1]
+    hashtags_line = paragraphs[-1][-1]
     assert "#robetommy" in hashtags_line
     assert "#robefemme" in hashtags_line
     assert "#pulltommy" not in hashtags_line
     assert "#gilettommy" not in hashtags_line
 
 
-def test_render_pull_tommy_femme_updates_hashtag_with_size() -> None:
-    template = ListingTemplateRegistry().get_template("template-pull-tommy-femme")
-
-    fields = ListingFields(
-        model="",
+def test_render_pull_tommy_femme_updates_hashtag_with_size(
+    pull_tommy_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(
         fr_size="XL",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
-        cotton_pct="",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="",
-        color_main="",
-        defects="",
-        defect_tags=(),
         size_label_visible=False,
         fabric_label_visible=False,
         sku="PTF42",
     )
 
-    _, description, _ = template.render(fields)
+    _, description, _ = _render(pull_tommy_femme_template, fields)
 
     paragraphs = description.split("\n\n")
     assert any("#durin31tfXL" in line for line in paragraphs[3].splitlines())
 
     hashtags_line = paragraphs[-1]
-    hashtags = [token for token in hashtags_line.split() if token.startswith("#")]
+    hashtags = _HASHTAG_RE.findall(hashtags_line)
     assert "#durin31tfXL" in hashtags
 
 
-def test_render_pull_tommy_femme_normalizes_extended_sizes() -> None:
-    template = ListingTemplateRegistry().get_template("template-pull-tommy-femme")
-
-    fields = ListingFields(
-        model="",
-        fr_size="1X",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
-        cotton_pct="",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="",
-        color_main="marine",
-        defects="",
-        defect_tags=(),
-        size_label_visible=True,
-        fabric_label_visible=False,
-        sku="PTF07",
-    )
+def test_render_pull_tommy_femme_normalizes_extended_sizes(
+    pull_tommy_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(fr_size="1X", color_main="marine", fabric_label_visible=False, sku="PTF07")
 
-    title, description, _ = template.render(fields)
+    title, description, _ = _render(pull_tommy_femme_template, fields)
 
     assert "taille XL" in title
     assert "1X" not in title
@@ -999,94 +690,34 @@ def test_render_pull_tommy_femme_normalizes_extended_sizes() -> None:
     assert "taille XL." in first_sentence
     assert "1X" not in description
 
-    hashtags_line = description.splitlines()[-1]
-    hashtags = [token for token in hashtags_line.split() if token.startswith("#")]
+    hashtags_line = description.rpartition("\n")[2]
+    hashtags = _HASHTAG_RE.findall(hashtags_line)
     assert "#durin31tfXL" in hashtags
 
 
-def test_render_pull_tommy_femme_marketing_highlight_varies_with_materials() -> None:
-    template = ListingTemplateRegistry().get_template("template-pull-tommy-femme")
-
-    cotton_fields = ListingFields(
-        model="",
-        fr_size="M",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
-        cotton_pct="95",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="",
-        color_main="bleu",
-        defects="",
-        defect_tags=(),
-        size_label_visible=True,
-        fabric_label_visible=True,
-        sku="",
-    )
-
-    cashmere_fields = ListingFields(
-        model="",
-        fr_size="M",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
+def test_render_pull_tommy_femme_marketing_highlight_varies_with_materials(
+    pull_tommy_femme_template: ListingTemplate,
+) -> None:
+    cotton_fields = _fields(fr_size="M", cotton_pct="95", color_main="bleu")
+    cashmere_fields = replace(
+        cotton_fields,
         cotton_pct="60",
         wool_pct="",
         cashmere_pct="15",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="",
         color_main="beige",
         knit_pattern="torsadé",
-        defects="",
-        defect_tags=(),
-        size_label_visible=True,
-        fabric_label_visible=True,
-        sku="",
     )
-
-    pure_cotton_fields = ListingFields(
-        model="",
-        fr_size="S",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
-        cotton_pct="100",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="",
-        color_main="blanc",
-        knit_pattern="rayé",
-        defects="",
-        defect_tags=(),
-        size_label_visible=True,
-        fabric_label_visible=True,
-        sku="",
+    pure_cotton_fields = replace(
+        cotton_fields, fr_size="S", cotton_pct="100", color_main="blanc", knit_pattern="rayé"
     )
 
-    _, cotton_description, _ = template.render(cotton_fields)
-    _, cashmere_description, _ = template.render(cashmere_fields)
-    _, pure_cotton_description, _ = template.render(pure_cotton_fields)
+    _, cotton_description, _ = _render(pull_tommy_femme_template, cotton_fields)
+    _, cashmere_description, _ = _render(pull_tommy_femme_template, cashmere_fields)
+    _, pure_cotton_description, _ = _render(pull_tommy_femme_template, pure_cotton_fields)
 
-    cotton_highlight = cotton_description.split("\n\n")[1].splitlines()[0]
-    cashmere_highlight = cashmere_description.split("\n\n")[1].splitlines()[0]
-    pure_cotton_highlight = pure_cotton_description.split("\n\n")[1].splitlines()[0]
+    cotton_highlight = cotton_description.split("\n\n", 2)[1].partition("\n")[0]
+    cashmere_highlight = cashmere_description.split("\n\n", 2)[1].partition("\n")[0]
+    pure_cotton_highlight = pure_cotton_description.split("\n\n", 2)[1].partition("\n")[0]
 
     assert cotton_highlight != cashmere_highlight
     assert "respir" in cotton_highlight.lower()
@@ -1094,325 +725,225 @@ def test_render_pull_tommy_femme_marketing_highlight_varies_with_materials() ->
     assert pure_cotton_highlight.startswith("Maille 100% coton")
 
 
-def test_render_pull_tommy_femme_uses_sku_placeholder_when_missing() -> None:
-    template = ListingTemplateRegistry().get_template("template-pull-tommy-femme")
-
-    fields = ListingFields(
-        model="",
-        fr_size="M",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
-        cotton_pct="100",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="",
-        color_main="rouge",
-        knit_pattern="marinière",
-        defects="",
-        defect_tags=(),
-        size_label_visible=True,
-        fabric_label_visible=True,
-        sku="",
-    )
+def test_render_pull_tommy_femme_uses_sku_placeholder_when_missing(
+    pull_tommy_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(fr_size="M", cotton_pct="100", color_main="rouge", knit_pattern="marinière")
 
-    title, description, _ = template.render(fields)
+    title, description, _ = _render(pull_tommy_femme_template, fields)
 
     assert title.endswith("SKU/nc")
     assert "Référence SKU" not in description
 
 
-def test_render_pull_tommy_femme_mentions_polyamide_in_composition() -> None:
-    template = ListingTemplateRegistry().get_template("template-pull-tommy-femme")
-
-    fields = ListingFields(
-        model="",
+def test_render_pull_tommy_femme_mentions_polyamide_in_composition(
+    pull_tommy_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(
         fr_size="L",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
         cotton_pct="55",
-        polyester_pct="",
         polyamide_pct="20",
-        viscose_pct="",
-        elastane_pct="",
-        gender="",
         color_main="gris",
         knit_pattern="col V",
-        defects="",
-        defect_tags=(),
-        size_label_visible=True,
-        fabric_label_visible=True,
         sku="PTF10",
     )
 
-    _, description, _ = template.render(fields)
+    _, description, _ = _render(pull_tommy_femme_template, fields)
 
     assert "20% polyamide" in description
 
 
-def test_render_pull_tommy_femme_handles_unreadable_composition() -> None:
-    template = ListingTemplateRegistry().get_template("template-pull-tommy-femme")
-
-    fields = ListingFields(
-        model="",
-        fr_size="M",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
-        cotton_pct="",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="",
-        color_main="",
-        defects="",
-        defect_tags=(),
-        size_label_visible=True,
-        fabric_label_visible=True,
-        sku="PTF88",
-    )
+def test_render_pull_tommy_femme_handles_unreadable_composition(
+    pull_tommy_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(fr_size="M", sku="PTF88")
 
-    _, description, _ = template.render(fields)
+    _, description, _ = _render(pull_tommy_femme_template, fields)
 
     assert "Composition non lisible sur l'étiquette" in description
 
 
-def test_render_pull_tommy_femme_title_avoids_pattern_duplicates() -> None:
-    template = ListingTemplateRegistry().get_template("template-pull-tommy-femme")
-
-    fields = ListingFields(
-        model="",
+def test_render_pull_tommy_femme_title_avoids_pattern_duplicates(
+    pull_tommy_femme_template: ListingTemplate,
+) -> None:
+    fields = _fields(
         fr_size="M",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
         cotton_pct="40",
-        polyester_pct="",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="",
         color_main="marron",
-        defects="",
-        defect_tags=(),
-        size_label_visible=True,
-        fabric_label_visible=True,
         sku="PTF1",
         wool_pct="60",
         knit_pattern="torsadé",
         made_in="Made in Portugal",
     )
 
-    title, description, _ = template.render(fields)
+    title, description, _ = _render(pull_tommy_femme_template, fields)
 
     assert (
         title
         == "Pull Tommy Hilfiger femme taille M en laine torsadée marron Made in Europe - PTF1"
     )
-    assert title.lower().count("torsad") == 1
+    assert occurs_once(title.lower(), "torsad")
     assert "maille torsadée" in description.splitlines()[1].lower()
 
 
-@pytest.mark.parametrize(
-    (
-        "pattern",
-        "expected_marketing_fragment",
-        "expected_style_sentence",
-        "expected_hashtags",
-        "extra_fields",
-        "expected_material_segment",
+_PULL_TOMMY_FEMME_BASE = _fields(
+    fr_size="M",
+    cotton_pct="70",
+    acrylic_pct="",
+    color_main="bleu",
+    sku="PTFRULE",
+    knit_pattern="",
+)
+
+
+class _PullTommyPatternCase(NamedTuple):
+    pattern: str
+    marketing: str
+    style: str
+    hashtags: tuple[str, ...]
+
+
+_PULL_TOMMY_FEMME_PATTERN_CASES: tuple[_PullTommyPatternCase, ...] = (
+    _PullTommyPatternCase(
+        "Losanges écossais",
+        "Les losanges écossais apportent une touche preppy iconique.",
+        "Motif argyle chic qui dynamise la silhouette.",
+        ("#pulllosange", "#argyle"),
+    ),
+    _PullTommyPatternCase(
+        "Rayé",
+        "Les rayures dynamisent la silhouette.",
+        "Les rayures insufflent une allure graphique intemporelle.",
+        ("#pullrayure", "#rayures"),
+    ),
+    _PullTommyPatternCase(
+        "Motif chevron",
+        "Le motif chevron structure le look avec élégance.",
+        "Motif chevron travaillé pour une allure sophistiquée.",
+        ("#pullchevron",),
+    ),
+    _PullTommyPatternCase(
+        "Motif damier",
+        "Le motif damier apporte une touche graphique affirmée.",
+        "Damier contrasté pour un twist visuel fort.",
+        ("#pulldamier",),
+    ),
+    _PullTommyPatternCase(
+        "Motif jacquard",
+        "La maille jacquard dévoile un motif travaillé très cosy.",
+        "Jacquard riche en détails pour une allure chaleureuse.",
+        ("#pulljacquard", "#fairisle"),
+    ),
+    _PullTommyPatternCase(
+        "Point de riz",
+        "La texture en relief apporte du volume et de la douceur.",
+        "Maille texturée qui joue sur les reliefs délicats.",
+        ("#pulltexturé",),
+    ),
+    _PullTommyPatternCase(
+        "Pied-de-poule",
+        "Le motif pied-de-poule signe une allure rétro-chic.",
+        "Pied-de-poule graphique pour une silhouette élégante.",
+        ("#pullpieddepoule",),
+    ),
+    _PullTommyPatternCase(
+        "Motif nordique",
+        "L’esprit nordique réchauffe vos looks d’hiver.",
+        "Motif nordique douillet esprit chalet.",
+        ("#pullnordique",),
+    ),
+    _PullTommyPatternCase(
+        "Motif bohème",
+        "Le motif bohème diffuse une vibe folk et décontractée.",
+        "Motif bohème pour une allure folk décontractée.",
+        ("#pullboheme",),
+    ),
+    _PullTommyPatternCase(
+        "Color block",
+        "Le color block joue sur les contrastes audacieux.",
+        "Color block énergique qui capte l’œil.",
+        ("#pullcolorblock",),
+    ),
+    _PullTommyPatternCase(
+        "Dégradé",
+        "Le dégradé nuance la maille avec subtilité.",
+        "Dégradé vaporeux pour un rendu tout en douceur.",
+        ("#pulldegrade",),
+    ),
+    _PullTommyPatternCase(
+        "Logo TH",
+        "Le logo mis en avant affirme le style Tommy.",
+        "Logo signature mis en valeur pour un look assumé.",
+        ("#pulllogo",),
+    ),
+    _PullTommyPatternCase(
+        "Motif graphique",
+        "Le motif graphique apporte une touche arty.",
+        "Graphismes audacieux pour une silhouette arty.",
+        ("#pullgraphique",),
+    ),
+    _PullTommyPatternCase(
+        "Motif inattendu",
+        "Motif motif inattendu pour une touche originale.",
+        "Motif motif inattendu sur un coloris bleu facile à associer.",
+        (),
     ),
-    [
-        (
-            "Losanges écossais",
-            "Les losanges écossais apportent une touche preppy iconique.",
-            "Motif argyle chic qui dynamise la silhouette.",
-            ["#pulllosange", "#argyle"],
-            {},
-            None,
-        ),
-        (
-            "Rayé",
-            "Les rayures dynamisent la silhouette.",
-            "Les rayures insufflent une allure graphique intemporelle.",
-            ["#pullrayure", "#rayures"],
-            {},
-            None,
-        ),
-        (
-            "Motif chevron",
-            "Le motif chevron structure le look avec élégance.",
-            "Motif chevron travaillé pour une allure sophistiquée.",
-            ["#pullchevron"],
-            {},
-            None,
-        ),
-        (
-            "Motif damier",
-            "Le motif damier apporte une touche graphique affirmée.",
-            "Damier contrasté pour un twist visuel fort.",
-            ["#pulldamier"],
-            {},
-            None,
-        ),
-        (
-            "Motif jacquard",
-            "La maille jacquard dévoile un motif travaillé très cosy.",
-            "Jacquard riche en détails pour une allure chaleureuse.",
-            ["#pulljacquard", "#fairisle"],
-            {},
-            None,
-        ),
-        (
-            "Torsadé",
-            "Les torsades apportent du relief cosy.",
-            "Maille torsadée iconique au charme artisanal.",
-            ["#pulltorsade"],
-            {"cotton_pct": "", "wool_pct": "60"},
-            "en laine torsadée",
-        ),
-        (
-            "Point de riz",
-            "La texture en relief apporte du volume et de la douceur.",
-            "Maille texturée qui joue sur les reliefs délicats.",
-            ["#pulltexturé"],
-            {},
-            None,
-        ),
-        (
-            "Pied-de-poule",
-            "Le motif pied-de-poule signe une allure rétro-chic.",
-            "Pied-de-poule graphique pour une silhouette élégante.",
-            ["#pullpieddepoule"],
-            {},
-            None,
-        ),
-        (
-            "Motif nordique",
-            "L’esprit nordique réchauffe vos looks d’hiver.",
-            "Motif nordique douillet esprit chalet.",
-            ["#pullnordique"],
-            {},
-            None,
-        ),
-        (
-            "Motif bohème",
-            "Le motif bohème diffuse une vibe folk et décontractée.",
-            "Motif bohème pour une allure folk décontractée.",
-            ["#pullboheme"],
-            {},
-            None,
-        ),
-        (
-            "Color block",
-            "Le color block joue sur les contrastes audacieux.",
-            "Color block énergique qui capte l’œil.",
-            ["#pullcolorblock"],
-            {},
-            None,
-        ),
-        (
-            "Dégradé",
-            "Le dégradé nuance la maille avec subtilité.",
-            "Dégradé vaporeux pour un rendu tout en douceur.",
-            ["#pulldegrade"],
-            {},
-            None,
-        ),
-        (
-            "Logo TH",
-            "Le logo mis en avant affirme le style Tommy.",
-            "Logo signature mis en valeur pour un look assumé.",
-            ["#pulllogo"],
-            {},
-            None,
-        ),
-        (
-            "Motif graphique",
-            "Le motif graphique apporte une touche arty.",
-            "Graphismes audacieux pour une silhouette arty.",
-            ["#pullgraphique"],
-            {},
-            None,
-        ),
-        (
-            "Motif inattendu",
-            "Motif motif inattendu pour une touche originale.",
-            "Motif motif inattendu sur un coloris bleu facile à associer.",
-            [],
-            {},
-            None,
-        ),
-    ],
 )
-def test_render_pull_tommy_femme_pattern_specific_rules(
-    pattern: str,
+
+
+def _assert_pull_tommy_femme_pattern_rules(
+    template: ListingTemplate,
+    fields: ListingFields,
     expected_marketing_fragment: str,
     expected_style_sentence: str,
-    expected_hashtags: list[str],
-    extra_fields: dict[str, object],
-    expected_material_segment: str | None,
+    expected_hashtags: Iterable[str],
+) -> str:
+    """Check the pattern-driven lines of a pull Tommy render and return its title."""
+
+    title, description, _ = _render(template, fields)
+    first_paragraph, _, rest = description.partition("\n\n")
+
+    marketing_line = rest.partition("\n\n")[0].partition("\n")[0]
+    assert expected_marketing_fragment in marketing_line
+    assert first_paragraph.split("\n", 2)[1] == expected_style_sentence
+    hashtags_paragraph = description.rsplit("\n\n", 1)[-1]
+    missing = set(expected_hashtags) - _hashtags(hashtags_paragraph.replace("\n", " "))
+    assert not missing, f"missing hashtags: {sorted(missing)}"
+    return title
+
+
+@pytest.mark.parametrize(
+    "case", _PULL_TOMMY_FEMME_PATTERN_CASES, ids=lambda case: case.pattern
+)
+def test_render_pull_tommy_femme_pattern_specific_rules(
+    case: _PullTommyPatternCase,
+    pull_tommy_femme_template: ListingTemplate,
 ) -> None:
-    template = ListingTemplateRegistry().get_template("template-pull-tommy-femme")
+    _assert_pull_tommy_femme_pattern_rules(
+        pull_tommy_femme_template,
+        replace(_PULL_TOMMY_FEMME_BASE, knit_pattern=case.pattern),
+        case.marketing,
+        case.style,
+        case.hashtags,
+    )
 
-    base_fields = {
-        "model": "",
-        "fr_size": "M",
-        "us_w": "",
-        "us_l": "",
-        "fit_leg": "",
-        "rise_class": "",
-        "rise_measurement_cm": None,
-        "waist_measurement_cm": None,
-        "cotton_pct": "70",
-        "polyester_pct": "",
-        "polyamide_pct": "",
-        "viscose_pct": "",
-        "elastane_pct": "",
-        "acrylic_pct": "",
-        "acrylic_pct": "",
-        "acrylic_pct": "",
-        "gender": "",
-        "color_main": "bleu",
-        "defects": "",
-        "defect_tags": (),
-        "size_label_visible": True,
-        "fabric_label_visible": True,
-        "sku": "PTFRULE",
-        "knit_pattern": pattern,
-    }
-    base_fields.update(extra_fields)
-    fields = ListingFields(**base_fields)
 
-    title, description, _ = template.render(fields)
-    paragraphs = description.split("\n\n")
-    marketing_line = paragraphs[1].splitlines()[0]
-    style_line = paragraphs[0].splitlines()[1]
-    hashtags_line = paragraphs[-1]
+def test_render_pull_tommy_femme_torsade_pattern_mentions_wool(
+    pull_tommy_femme_template: ListingTemplate,
+) -> None:
+    fields = replace(
+        _PULL_TOMMY_FEMME_BASE, knit_pattern="Torsadé", cotton_pct="", wool_pct="60"
+    )
 
-    assert expected_marketing_fragment in marketing_line
-    assert style_line == expected_style_sentence
-    for tag in expected_hashtags:
-        assert tag in hashtags_line
+    title = _assert_pull_tommy_femme_pattern_rules(
+        pull_tommy_femme_template,
+        fields,
+        "Les torsades apportent du relief cosy.",
+        "Maille torsadée iconique au charme artisanal.",
+        ("#pulltorsade",),
+    )
 
-    if expected_material_segment:
-        assert expected_material_segment in title
+    assert "en laine torsadée" in title
 
 
 def _build_base_polaire_payload(**overrides: object) -> dict[str, object]:
@@ -1435,7 +966,7 @@ def _build_base_polaire_payload(**overrides: object) -> dict[str, object]:
         "gender": "Femme",
         "color_main": "noir",
         "defects": "",
-        "defect_tags": [],
+        "defect_tags": (),
         "size_label_visible": True,
         "fabric_label_visible": True,
         "fabric_label_cut": False,
@@ -1458,132 +989,182 @@ def _build_base_polaire_payload(**overrides: object) -> dict[str, object]:
     return payload
 
 
-def test_listing_fields_accepts_polaire_sku_prefixes() -> None:
-    base_payload = _build_base_polaire_payload(sku="PTNF12", brand="The North Face")
-    fields = ListingFields.from_dict(base_payload, template_name="template-polaire-outdoor")
-    assert fields.sku == "PTNF12"
+_POLAIRE_BASE_FIELDS = ListingFields.from_dict(
+    _build_base_polaire_payload(), template_name=_TPL_POLAIRE
+)
 
-    columbia_payload = _build_base_polaire_payload(
-        sku="PC9", brand="Columbia", polyester_pct="95", cotton_pct="5"
-    )
-    fields_col = ListingFields.from_dict(
-        columbia_payload, template_name="template-polaire-outdoor"
-    )
-    assert fields_col.sku == "PC9"
 
+@pytest.fixture(scope="session")
+def polaire_payload() -> Mapping[str, object]:
+    """Read-only base polaire payload; tests copy it with ``dict(polaire_payload, ...)``."""
 
-def test_listing_fields_normalizes_polaire_sku_variants() -> None:
-    payload = _build_base_polaire_payload(sku="ptnf 12", brand="The North Face")
-    fields = ListingFields.from_dict(payload, template_name="template-polaire-outdoor")
-    assert fields.sku == "PTNF12"
+    return MappingProxyType(_build_base_polaire_payload())
 
-    digits_only_payload = _build_base_polaire_payload(sku="17", brand="The North Face")
-    digits_only_fields = ListingFields.from_dict(
-        digits_only_payload, template_name="template-polaire-outdoor"
-    )
-    assert digits_only_fields.sku == ""
 
-    compact_payload = _build_base_polaire_payload(sku="pc12", brand="Columbia")
-    compact_fields = ListingFields.from_dict(
-        compact_payload, template_name="template-polaire-outdoor"
-    )
-    assert compact_fields.sku == ""
+def test_listing_fields_accepts_polaire_sku_prefixes(
+    polaire_payload: Mapping[str, object],
+) -> None:
+    base_payload = dict(polaire_payload, sku="PTNF12", brand="The North Face")
+    fields = ListingFields.from_dict(base_payload, template_name=_TPL_POLAIRE)
+    assert fields.sku == "PTNF12"
 
-    long_payload = _build_base_polaire_payload(sku="ptnf-1234", brand="The North Face")
-    long_fields = ListingFields.from_dict(
-        long_payload, template_name="template-polaire-outdoor"
+    columbia_payload = dict(
+        polaire_payload, sku="PC9", brand="Columbia", polyester_pct="95", cotton_pct="5"
     )
-    assert long_fields.sku == "PTNF123"
-
+    fields_col = ListingFields.from_dict(
+        columbia_payload, template_name=_TPL_POLAIRE
+    )
+    assert fields_col.sku == "PC9"
 
-def test_listing_fields_rejects_mismatched_polaire_brand_and_sku() -> None:
-    payload = _build_base_polaire_payload(sku="PTNF20", brand="Columbia")
-    with pytest.raises(ValueError):
-        ListingFields.from_dict(payload, template_name="template-polaire-outdoor")
 
+@pytest.mark.parametrize(
+    "raw_sku, brand, expected",
+    [
+        ("ptnf 12", "The North Face", "PTNF12"),
+        ("17", "The North Face", ""),
+        ("pc12", "Columbia", ""),
+        ("ptnf-1234", "The North Face", "PTNF123"),
+    ],
+)
+def test_listing_fields_normalizes_polaire_sku_variants(
+    polaire_payload: Mapping[str, object], raw_sku: str, brand: str, expected: str
+) -> None:
+    payload = dict(polaire_payload, sku=raw_sku, brand=brand)
+    fields = ListingFields.from_dict(payload, template_name=_TPL_POLAIRE)
+    assert fields.sku == expected
 
-def test_render_polaire_outdoor_applies_polyester_default_and_brand_hashtags() -> None:
-    template = ListingTemplateRegistry().get_template("template-polaire-outdoor")
-    fields = ListingFields(
-        model="Denali",
-        fr_size="M",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
-        cotton_pct="",
-        polyester_pct="100",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="Femme",
-        color_main="noir",
-        defects="Petite tache sur la manche",
-        defect_tags=(),
-        size_label_visible=False,
-        fabric_label_visible=False,
-        fabric_label_cut=False,
-        sku="PTNF42",
-        brand="The North Face",
-        zip_style="1/4 zip",
-        neckline_style="col montant",
-        feature_notes="Col montant doublé",
-        technical_features="Polartec recyclé",
-        special_logo="ruban rose",
-        has_hood=True,
-        bust_flat_measurement_cm=49.0,
-        length_measurement_cm=62.0,
-        sleeve_measurement_cm=60.0,
-        shoulder_measurement_cm=41.0,
-        waist_flat_measurement_cm=48.0,
-        hem_flat_measurement_cm=47.0,
-    )
 
-    title, description, _ = template.render(fields)
+def test_listing_fields_rejects_mismatched_polaire_brand_and_sku(
+    polaire_payload: Mapping[str, object],
+) -> None:
+    payload = dict(polaire_payload, sku="PTNF20", brand="Columbia")
+    with pytest.raises(ValueError):
+        ListingFields.from_dict(payload, template_name=_TPL_POLAIRE)
 
-    assert "Polaire fleece The North Face" in title
-    assert "PTNF42" in title
-    assert "1/4 zip" in title
-    assert "col montant" in title
-    assert "ruban rose" in title
-    assert "Composition : 100% polyester" in description
-    assert description.count(COMBINED_LABEL_MISSING_MESSAGE) == 1
 
-    hashtags_line = description.splitlines()[-1]
-    assert "#thenorthface" in hashtags_line
-    assert "#polairefemme" in hashtags_line
-    assert "#durin31tnfM" in hashtags_line
-    assert "#durin31fM" in hashtags_line
+@pytest.mark.parametrize(
+    (
+        "overrides, title_contains, description_contains, description_once, "
+        "description_missing, hashtags"
+    ),
+    [
+        pytest.param(
+            {
+                "defects": "Petite tache sur la manche",
+                "size_label_visible": False,
+                "fabric_label_visible": False,
+                "non_size_labels_visible": False,
+                "sku": "PTNF42",
+                "feature_notes": "Col montant doublé",
+                "bust_flat_measurement_cm": 49.0,
+                "length_measurement_cm": 62.0,
+                "sleeve_measurement_cm": 60.0,
+                "shoulder_measurement_cm": 41.0,
+                "hem_flat_measurement_cm": 47.0,
+                "special_logo": "ruban rose",
+            },
+            ("Polaire fleece The North Face", "PTNF42", "1/4 zip", "col montant", "ruban rose"),
+            ("Composition : 100% polyester",),
+            (COMBINED_LABEL_MISSING_MESSAGE,),
+            (),
+            ("#thenorthface", "#polairefemme", "#durin31tnfM", "#durin31fM"),
+            id="polyester-default-and-brand-hashtags",
+        ),
+        pytest.param(
+            {
+                "defects": "Matière rappelant plutôt un mélange coton",
+                "size_label_visible": False,
+                "fabric_label_visible": False,
+                "non_size_labels_visible": False,
+                "sku": "PTNF43",
+                "feature_notes": "Col montant doublé",
+                "bust_flat_measurement_cm": 49.0,
+                "length_measurement_cm": 62.0,
+                "sleeve_measurement_cm": 60.0,
+                "shoulder_measurement_cm": 41.0,
+                "hem_flat_measurement_cm": 47.0,
+            },
+            (),
+            (COMBINED_LABEL_MISSING_MESSAGE,),
+            (),
+            ("Composition : 100% polyester",),
+            (),
+            id="no-polyester-default-when-defects-mention-fiber",
+        ),
+        pytest.param(
+            {
+                "brand": "Columbia",
+                "model": "Fast Trek II",
+                "fr_size": "L",
+                "cotton_pct": "20",
+                "polyester_pct": "80",
+                "color_main": "bleu",
+                "sku": "PC7",
+                "zip_style": "zip intégral",
+                "feature_notes": "Poches zippées",
+                "technical_features": "Omni-Heat",
+                "special_logo": "patch expédition",
+                "has_hood": False,
+                "non_size_labels_visible": False,
+                "bust_flat_measurement_cm": 52.0,
+                "length_measurement_cm": 64.0,
+                "sleeve_measurement_cm": 61.0,
+                "waist_flat_measurement_cm": 50.0,
+                "hem_flat_measurement_cm": 51.0,
+            },
+            ("Polaire fleece Columbia", "en coton", "PC7", "patch expédition"),
+            ("Poches zippées", "Omni-Heat", "80% polyester"),
+            (),
+            (),
+            ("#columbia", "#durin31colL", "#matierepremium"),
+            id="columbia-material-and-hashtags",
+        ),
+    ],
+)
+def test_render_polaire_outdoor(
+    overrides: dict[str, object],
+    title_contains: tuple[str, ...],
+    description_contains: tuple[str, ...],
+    description_once: tuple[str, ...],
+    description_missing: tuple[str, ...],
+    hashtags: tuple[str, ...],
+    polaire_outdoor_template: ListingTemplate,
+) -> None:
+    fields = replace(_POLAIRE_BASE_FIELDS, **overrides)
+
+    title, description, _ = _render(polaire_outdoor_template, fields)
+
+    missing = [fragment for fragment in title_contains if fragment not in title]
+    assert not missing, missing
+    missing = [fragment for fragment in description_contains if fragment not in description]
+    assert not missing, missing
+    for fragment in description_once:
+        assert occurs_once(description, fragment), fragment
+    unexpected = [fragment for fragment in description_missing if fragment in description]
+    assert not unexpected, unexpected
+
+    missing = set(hashtags) - _hashtags(description.rpartition("\n")[2])
+    assert not missing, f"missing hashtags: {sorted(missing)}"
+
+
+_RECOVER_FAKE_RESPONSE_TEXT = json.dumps(
+    {
+        "fields": _build_base_polaire_payload(
+            sku="",
+            brand="The North Face",
+            fabric_label_visible=False,
+            non_size_labels_visible=False,
+        )
+    }
+)
 
 
 def test_generate_listing_recovers_missing_polaire_sku(
     monkeypatch: pytest.MonkeyPatch,
+    polaire_outdoor_template: ListingTemplate,
+    generator: ListingGenerator,
 ) -> None:
-    template = ListingTemplateRegistry().get_template("template-polaire-outdoor")
-    base_payload = _build_base_polaire_payload(
-        sku="", brand="The North Face", fabric_label_visible=False, non_size_labels_visible=False
-    )
-    payload = {"fields": base_payload}
-
-    class _FakeResponse:
-        def __init__(self, text: str) -> None:
-            self.output_text = text
-
-    class _FakeResponses:
-        def __init__(self, text: str) -> None:
-            self._text = text
-
-        def create(self, **_kwargs: object) -> _FakeResponse:
-            return _FakeResponse(self._text)
-
-    class _FakeClient:
-        def __init__(self, text: str) -> None:
-            self.responses = _FakeResponses(text)
-
-    generator = ListingGenerator()
-    generator._client = _FakeClient(json.dumps(payload))  # type: ignore[attr-defined]
+    generator._client = FakeClient(_RECOVER_FAKE_RESPONSE_TEXT)  # type: ignore[attr-defined]
 
     captured: dict[str, Any] = {}
 
@@ -1596,7 +1177,9 @@ def test_generate_listing_recovers_missing_polaire_sku(
 
     monkeypatch.setattr(ListingGenerator, "_recover_polaire_sku", _fake_recover, raising=True)
 
-    result = generator.generate_listing(["data:image/png;base64,AAA"], "", template, "")
+    result = generator.generate_listing(
+        ["data:image/png;base64,AAA"], "", polaire_outdoor_template, ""
+    )
 
     assert result.sku_missing is True
     assert "SKU/nc" in result.title
@@ -1606,9 +1189,12 @@ def test_generate_listing_recovers_missing_polaire_sku(
 
 def test_generate_listing_ignores_polaire_sku_when_labels_hidden(
     monkeypatch: pytest.MonkeyPatch,
+    polaire_outdoor_template: ListingTemplate,
+    generator: ListingGenerator,
+    polaire_payload: Mapping[str, object],
 ) -> None:
-    template = ListingTemplateRegistry().get_template("template-polaire-outdoor")
-    base_payload = _build_base_polaire_payload(
+    base_payload = dict(
+        polaire_payload,
         sku="PTNF55",
         brand="The North Face",
         fabric_label_visible=False,
@@ -1616,23 +1202,7 @@ def test_generate_listing_ignores_polaire_sku_when_labels_hidden(
     )
     payload = {"fields": base_payload}
 
-    class _FakeResponse:
-        def __init__(self, text: str) -> None:
-            self.output_text = text
-
-    class _FakeResponses:
-        def __init__(self, text: str) -> None:
-            self._text = text
-
-        def create(self, **_kwargs: object) -> _FakeResponse:
-            return _FakeResponse(self._text)
-
-    class _FakeClient:
-        def __init__(self, text: str) -> None:
-            self.responses = _FakeResponses(text)
-
-    generator = ListingGenerator()
-    generator._client = _FakeClient(json.dumps(payload))  # type: ignore[attr-defined]
+    generator._client = FakeClient(json.dumps(payload))  # type: ignore[attr-defined]
 
     captured: dict[str, Any] = {}
 
@@ -1645,7 +1215,9 @@ def test_generate_listing_ignores_polaire_sku_when_labels_hidden(
 
     monkeypatch.setattr(ListingGenerator, "_recover_polaire_sku", _fake_recover, raising=True)
 
-    result = generator.generate_listing(["data:image/png;base64,BBB"], "", template, "")
+    result = generator.generate_listing(
+        ["data:image/png;base64,BBB"], "", polaire_outdoor_template, ""
+    )
 
     assert result.sku_missing is True
     assert "SKU/nc" in result.title
@@ -1653,19 +1225,22 @@ def test_generate_listing_ignores_polaire_sku_when_labels_hidden(
     assert captured["comment"] == ""
 
 
-def test_listing_fields_clear_polaire_sku_when_labels_unreadable() -> None:
-    template = ListingTemplateRegistry().get_template("template-polaire-outdoor")
-    payload = _build_base_polaire_payload(
+def test_listing_fields_clear_polaire_sku_when_labels_unreadable(
+    polaire_outdoor_template: ListingTemplate,
+    polaire_payload: Mapping[str, object],
+) -> None:
+    payload = dict(
+        polaire_payload,
         sku="PTNF1",
         fabric_label_visible=False,
         non_size_labels_visible=False,
     )
 
-    fields = ListingFields.from_dict(payload, template_name="template-polaire-outdoor")
+    fields = ListingFields.from_dict(payload, template_name=_TPL_POLAIRE)
 
     assert fields.sku == ""
 
-    title, description, _ = template.render(fields)
+    title, description, _ = _render(polaire_outdoor_template, fields)
 
     assert "SKU/nc" in title
     assert "Référence SKU" not in description
@@ -1679,29 +1254,17 @@ def test_listing_fields_clear_polaire_sku_when_labels_unreadable() -> None:
     ],
 )
 def test_generate_listing_ignores_numeric_polaire_sku(
-    monkeypatch: pytest.MonkeyPatch, raw_sku: str, brand: str
+    monkeypatch: pytest.MonkeyPatch,
+    raw_sku: str,
+    brand: str,
+    polaire_outdoor_template: ListingTemplate,
+    generator: ListingGenerator,
+    polaire_payload: Mapping[str, object],
 ) -> None:
-    template = ListingTemplateRegistry().get_template("template-polaire-outdoor")
-    base_payload = _build_base_polaire_payload(sku=raw_sku, brand=brand)
+    base_payload = dict(polaire_payload, sku=raw_sku, brand=brand)
     payload = {"fields": base_payload}
 
-    class _FakeResponse:
-        def __init__(self, text: str) -> None:
-            self.output_text = text
-
-    class _FakeResponses:
-        def __init__(self, text: str) -> None:
-            self._text = text
-
-        def create(self, **_kwargs: object) -> _FakeResponse:
-            return _FakeResponse(self._text)
-
-    class _FakeClient:
-        def __init__(self, text: str) -> None:
-            self.responses = _FakeResponses(text)
-
-    generator = ListingGenerator()
-    generator._client = _FakeClient(json.dumps(payload))  # type: ignore[attr-defined]
+    generator._client = FakeClient(json.dumps(payload))  # type: ignore[attr-defined]
 
     def _fake_recover(
         self: ListingGenerator, encoded_images: list[str], user_comment: str
@@ -1710,108 +1273,10 @@ def test_generate_listing_ignores_numeric_polaire_sku(
 
     monkeypatch.setattr(ListingGenerator, "_recover_polaire_sku", _fake_recover, raising=True)
 
-    result = generator.generate_listing(["data:image/png;base64,CCC"], "", template, "")
+    result = generator.generate_listing(
+        ["data:image/png;base64,CCC"], "", polaire_outdoor_template, ""
+    )
 
     assert result.sku_missing is True
     assert "PTNF" not in result.title
     assert "PC" not in result.title
-
-
-def test_render_polaire_outdoor_skips_polyester_default_when_defects_mentions_fiber() -> None:
-    template = ListingTemplateRegistry().get_template("template-polaire-outdoor")
-    fields = ListingFields(
-        model="Denali",
-        fr_size="M",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
-        cotton_pct="",
-        polyester_pct="100",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="Femme",
-        color_main="noir",
-        defects="Matière rappelant plutôt un mélange coton",
-        defect_tags=(),
-        size_label_visible=False,
-        fabric_label_visible=False,
-        fabric_label_cut=False,
-        sku="PTNF43",
-        brand="The North Face",
-        zip_style="1/4 zip",
-        neckline_style="col montant",
-        feature_notes="Col montant doublé",
-        technical_features="Polartec recyclé",
-        special_logo="",
-        has_hood=True,
-        bust_flat_measurement_cm=49.0,
-        length_measurement_cm=62.0,
-        sleeve_measurement_cm=60.0,
-        shoulder_measurement_cm=41.0,
-        waist_flat_measurement_cm=48.0,
-        hem_flat_measurement_cm=47.0,
-    )
-
-    _, description, _ = template.render(fields)
-
-    assert "Composition : 100% polyester" not in description
-    assert COMBINED_LABEL_MISSING_MESSAGE in description
-
-
-def test_render_polaire_outdoor_handles_columbia_material_and_hashtags() -> None:
-    template = ListingTemplateRegistry().get_template("template-polaire-outdoor")
-    fields = ListingFields(
-        model="Fast Trek II",
-        fr_size="L",
-        us_w="",
-        us_l="",
-        fit_leg="",
-        rise_class="",
-        rise_measurement_cm=None,
-        waist_measurement_cm=None,
-        cotton_pct="20",
-        polyester_pct="80",
-        polyamide_pct="",
-        viscose_pct="",
-        elastane_pct="",
-        gender="Femme",
-        color_main="bleu",
-        defects="",
-        defect_tags=(),
-        size_label_visible=True,
-        fabric_label_visible=True,
-        fabric_label_cut=False,
-        sku="PC7",
-        brand="Columbia",
-        zip_style="zip intégral",
-        neckline_style="col montant",
-        feature_notes="Poches zippées",
-        technical_features="Omni-Heat",
-        special_logo="patch expédition",
-        has_hood=False,
-        bust_flat_measurement_cm=52.0,
-        length_measurement_cm=64.0,
-        sleeve_measurement_cm=61.0,
-        shoulder_measurement_cm=42.0,
-        waist_flat_measurement_cm=50.0,
-        hem_flat_measurement_cm=51.0,
-    )
-
-    title, description, _ = template.render(fields)
-
-    assert "Polaire fleece Columbia" in title
-    assert "en coton" in title
-    assert "PC7" in title
-    assert "Poches zippées" in description
-    assert "Omni-Heat" in description
-    assert "patch expédition" in title
-    assert "80% polyester" in description
-
-    hashtags_line = description.splitlines()[-1]
-    assert "#columbia" in hashtags_line
-    assert "#durin31colL" in hashtags_line
-    assert "#matierepremium" in hashtags_line
@@ -0,0 +1,58 @@
+"""Test-suite wide setup: import path and shared, read-only template fixtures."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.backend.gpt_client import ListingGenerator
+from app.backend.templates import ListingTemplate, ListingTemplateRegistry
+
+
+@pytest.fixture(scope="session")
+def template_registry() -> ListingTemplateRegistry:
+    """Registry shared by the session (one per xdist worker); templates are read-only."""
+
+    return ListingTemplateRegistry()
+
+
+@pytest.fixture(scope="session")
+def default_template(template_registry: ListingTemplateRegistry) -> ListingTemplate:
+    return template_registry.get_template(template_registry.default_template)
+
+
+@pytest.fixture(scope="session")
+def jean_levis_femme_template(template_registry: ListingTemplateRegistry) -> ListingTemplate:
+    return template_registry.get_template("template-jean-levis-femme")
+
+
+@pytest.fixture(scope="session")
+def pull_tommy_femme_template(template_registry: ListingTemplateRegistry) -> ListingTemplate:
+    return template_registry.get_template("template-pull-tommy-femme")
+
+
+@pytest.fixture(scope="session")
+def polaire_outdoor_template(template_registry: ListingTemplateRegistry) -> ListingTemplate:
+    return template_registry.get_template("template-polaire-outdoor")
+
+
+@pytest.fixture(scope="session")
+def _session_generator() -> ListingGenerator:
+    """Only reach this through ``generator``, which resets the client per test."""
+
+    return ListingGenerator(model="fake", api_key="test")
+
+
+@pytest.fixture
+def generator(
+    _session_generator: ListingGenerator, monkeypatch: pytest.MonkeyPatch
+) -> ListingGenerator:
+    """Session-wide generator; whatever client a test installs is reset afterwards."""
+
+    monkeypatch.setattr(_session_generator, "_client", None)
+    return _session_generator
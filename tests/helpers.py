@@ -0,0 +1,66 @@
+"""Assertion helpers and OpenAI client doubles shared by the test modules."""
+from __future__ import annotations
+
+
+def occurs_once(text: str, needle: str) -> bool:
+    """Return ``True`` when ``needle`` appears exactly once in ``text``."""
+
+    first = text.find(needle)
+    return first != -1 and first == text.rfind(needle)
+
+
+class FakeResponse:
+    __slots__ = ("output_text",)
+
+    def __init__(self, text: str) -> None:
+        self.output_text = text
+
+
+class FakeContent:
+    __slots__ = ("text",)
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+class FakeBlock:
+    __slots__ = ("content",)
+
+    def __init__(self, content: tuple[FakeContent, ...]) -> None:
+        self.content = content
+
+
+class FakeBlockResponse:
+    __slots__ = ("output",)
+
+    def __init__(self, output: tuple[FakeBlock, ...]) -> None:
+        self.output = output
+
+
+class FakeResponses:
+    __slots__ = ("_response",)
+
+    def __init__(self, response: object) -> None:
+        self._response = response
+
+    def create(self, **_kwargs: object) -> object:
+        return self._response
+
+
+class FakeClient:
+    """Stand-in for ``OpenAI`` whose ``responses.create`` always returns ``text``."""
+
+    __slots__ = ("responses",)
+
+    def __init__(self, text: str) -> None:
+        self.responses = FakeResponses(FakeResponse(text))
+
+
+class FakeBlockClient:
+    """Like ``FakeClient`` but nests ``text`` in ``output[].content[].text`` blocks."""
+
+    __slots__ = ("responses",)
+
+    def __init__(self, text: str) -> None:
+        block = FakeBlock(content=(FakeContent(text),))
+        self.responses = FakeResponses(FakeBlockResponse(output=(block,)))
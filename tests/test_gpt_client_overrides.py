@@ -1,14 +1,14 @@
 """Integration tests for user overrides in listing generation."""
 
 from app.backend.gpt_client import ListingGenerator
-from app.backend.templates import ListingTemplateRegistry
+from app.backend.templates import ListingTemplate
 from app.backend.listing_fields import ListingFields
 
 
-def test_apply_user_overrides_propagates_fr_size_to_render() -> None:
-    generator = ListingGenerator(model="fake", api_key="test")
-    template = ListingTemplateRegistry().get_template("template-jean-levis-femme")
-
+def test_apply_user_overrides_propagates_fr_size_to_render(
+    jean_levis_femme_template: ListingTemplate,
+    generator: ListingGenerator,
+) -> None:
     fields = ListingFields(
         model="501",
         fr_size="38",
@@ -38,7 +38,7 @@ def test_apply_user_overrides_propagates_fr_size_to_render() -> None:
 
     assert overridden_fields.fr_size == "40"
 
-    title, description, price_estimate = template.render(overridden_fields)
+    title, description, price_estimate = jean_levis_femme_template.render(overridden_fields)
 
     assert "FR40" in title
     assert "40 FR" in description
@@ -46,10 +46,10 @@ def test_apply_user_overrides_propagates_fr_size_to_render() -> None:
     assert "FR 40" in price_estimate
 
 
-def test_apply_user_overrides_preserves_us_size_when_explicit() -> None:
-    generator = ListingGenerator(model="fake", api_key="test")
-    template = ListingTemplateRegistry().get_template("template-jean-levis-femme")
-
+def test_apply_user_overrides_preserves_us_size_when_explicit(
+    jean_levis_femme_template: ListingTemplate,
+    generator: ListingGenerator,
+) -> None:
     fields = ListingFields(
         model="501",
         fr_size="38",
@@ -81,16 +81,14 @@ def test_apply_user_overrides_preserves_us_size_when_explicit() -> None:
     assert overridden_fields.us_w == "30"
     assert overridden_fields.us_l == "32"
 
-    title, description, _ = template.render(overridden_fields)
+    title, description, _ = jean_levis_femme_template.render(overridden_fields)
 
     assert "W30" in title
     assert "L32" in title
     assert "30 US (équivalent 40 FR)" in description
 
 
-def test_apply_user_overrides_strips_sizes_when_label_missing() -> None:
-    generator = ListingGenerator(model="fake", api_key="test")
-
+def test_apply_user_overrides_strips_sizes_when_label_missing(generator: ListingGenerator) -> None:
     fields = ListingFields(
         model="511",
         fr_size="38",
@@ -122,9 +120,9 @@ def test_apply_user_overrides_strips_sizes_when_label_missing() -> None:
     assert sanitized_fields.waist_measurement_cm == 72.0
 
 
-def test_apply_user_overrides_strips_sizes_when_comment_without_override() -> None:
-    generator = ListingGenerator(model="fake", api_key="test")
-
+def test_apply_user_overrides_strips_sizes_when_comment_without_override(
+    generator: ListingGenerator,
+) -> None:
     fields = ListingFields(
         model="721",
         fr_size="36",
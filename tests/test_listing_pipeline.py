@@ -2,25 +2,22 @@
 from __future__ import annotations
 
 import json
-import sys
-from pathlib import Path
+from dataclasses import replace
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping
 
 import pytest
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
 from app.backend.gpt_client import ListingGenerator
 from app.backend.listing_fields import ListingFields
 from app.backend.sizing import NormalizedSizes, normalize_sizes
-from app.backend.templates import ListingTemplateRegistry, render_template_jean_levis_femme
+from app.backend.templates import (
+    ListingTemplate,
+    ListingTemplateRegistry,
+    render_template_jean_levis_femme,
+)
 from app.backend.text_normalization import normalize_fit_terms
-
-
-@pytest.fixture
-def template_registry() -> ListingTemplateRegistry:
-    return ListingTemplateRegistry()
+from tests.helpers import FakeBlockClient, occurs_once
 
 
 MEASUREMENT_EMPTY = {
@@ -33,44 +30,117 @@ MEASUREMENT_EMPTY = {
 }
 
 
+_BASE_PAYLOAD: Mapping[str, Any] = MappingProxyType(
+    {
+        "model": "501",
+        "fr_size": "38",
+        "us_w": "28",
+        "us_l": "30",
+        "fit_leg": "bootcut",
+        "rise_class": "haute",
+        "rise_measurement_cm": "",
+        "waist_measurement_cm": "",
+        **MEASUREMENT_EMPTY,
+        "cotton_pct": "99",
+        "polyester_pct": "0",
+        "polyamide_pct": "",
+        "viscose_pct": "0",
+        "acrylic_pct": "",
+        "elastane_pct": "1",
+        "gender": "Femme",
+        "color_main": "Bleu",
+        "defects": "aucun défaut",
+        "sku": "JLF6",
+        "defect_tags": (),
+        "size_label_visible": True,
+        "fabric_label_visible": True,
+    }
+)
+
+# Parsed once for render tests whose variants need no from_dict normalization.
+_BASE_FIELDS = ListingFields.from_dict(_BASE_PAYLOAD)
+
+
 SIZE_LABEL_CUT_MESSAGE = "Étiquette de taille coupée pour plus de confort."
 COMPOSITION_LABEL_CUT_MESSAGE = "Étiquette de composition coupée pour plus de confort."
 COMBINED_LABEL_CUT_MESSAGE = "Étiquettes de taille et composition coupées pour plus de confort."
 
 
+_GENERATOR_FIELDS: dict[str, object] = {
+    **_BASE_PAYLOAD,
+    "fr_size": "44",
+    "fit_leg": "slim",
+    "rise_class": "moyenne",
+    "defects": "aucune anomalie",
+}
+_FIELDS_JSON_TEXT = json.dumps({"fields": _GENERATOR_FIELDS})
+_INVALID_SKU_FIELDS_JSON_TEXT = json.dumps({"fields": {**_GENERATOR_FIELDS, "sku": "PTF12"}})
+
+
+def _parse_fields(**overrides: Any) -> ListingFields:
+    """Parse ``_BASE_PAYLOAD`` with ``overrides`` through ``ListingFields.from_dict``."""
+
+    return ListingFields.from_dict({**_BASE_PAYLOAD, **overrides})
+
+
+def _paragraph_first_line(description: str, index: int) -> str:
+    """Return the first line of paragraph ``index`` by slicing, without splitting."""
+
+    start = 0
+    for _ in range(index):
+        start = description.index("\n\n", start) + 2
+    end = description.find("\n", start)
+    return description[start:] if end == -1 else description[start:end]
+
+
+_LEVIS_INSTRUCTION_TERMS = (
+    "faded_crotch",
+    "entrejambe délavé",
+    "stylish_holes",
+    "effet troué",
+    "waist_measurement_cm",
+    "tour de taille",
+    "viscose_pct",
+    "nylon_pct",
+    "acrylic_pct",
+    "polyamide_pct",
+)
+
+_PULL_TOMMY_INSTRUCTION_TERMS = (
+    "wool_pct",
+    "cashmere_pct",
+    "knit_pattern",
+    "PTF",
+    "Made in Europe",
+    "nylon_pct",
+    "acrylic_pct",
+    "polyamide_pct",
+    "bust_flat_measurement_cm",
+    "largeur de poitrine à plat",
+    "length_measurement_cm",
+    "sleeve_measurement_cm",
+    "waist_flat_measurement_cm",
+    "hem_flat_measurement_cm",
+    "N'invente jamais de matière",
+    "la génération échouera",
+)
+
+
+def _missing_terms(text: str, terms: Iterable[str]) -> list[str]:
+    """Return the ``terms`` absent from ``text``, so one assert reports them all."""
+
+    return [term for term in terms if term not in text]
+
+
 def test_json_instruction_mentions_defect_synonyms() -> None:
     instruction = ListingFields.json_instruction()
-    assert "faded_crotch" in instruction
-    assert "entrejambe délavé" in instruction
-    assert "stylish_holes" in instruction
-    assert "effet troué" in instruction
-    assert "waist_measurement_cm" in instruction
-    assert "tour de taille" in instruction
-    assert "viscose_pct" in instruction
-    assert "nylon_pct" in instruction
-    assert "acrylic_pct" in instruction
-    assert "polyamide_pct" in instruction
+    assert not _missing_terms(instruction, _LEVIS_INSTRUCTION_TERMS)
 
 
 def test_json_instruction_for_pull_tommy_mentions_new_fields() -> None:
     instruction = ListingFields.json_instruction("template-pull-tommy-femme")
-    assert "wool_pct" in instruction
-    assert "cashmere_pct" in instruction
-    assert "knit_pattern" in instruction
-    assert "PTF" in instruction
-    assert "Made in Europe" in instruction
-    assert "nylon_pct" in instruction
-    assert "acrylic_pct" in instruction
-    assert "polyamide_pct" in instruction
-    assert "bust_flat_measurement_cm" in instruction
-    assert "largeur de poitrine à plat" in instruction
-    assert "length_measurement_cm" in instruction
-    assert "sleeve_measurement_cm" in instruction
-    assert "waist_flat_measurement_cm" in instruction
-    assert "hem_flat_measurement_cm" in instruction
-    assert "N'invente jamais de matière" in instruction
+    assert not _missing_terms(instruction, _PULL_TOMMY_INSTRUCTION_TERMS)
     assert "dans le titre" in instruction.lower()
-    assert "la génération échouera" in instruction
 
 
 def test_listing_fields_from_dict_requires_all_keys() -> None:
@@ -99,77 +169,39 @@ def test_listing_fields_from_dict_requires_all_keys() -> None:
         ListingFields.from_dict(payload)
 
 
-def test_listing_fields_enforces_sku_prefix_by_gender() -> None:
-    base_payload = {
-        "model": "501",
-        "fr_size": "38",
-        "us_w": "28",
-        "us_l": "30",
-        "fit_leg": "bootcut",
-        "rise_class": "haute",
-        "rise_measurement_cm": "",
-        "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-        "cotton_pct": "99",
-        "polyester_pct": "0",
-        "viscose_pct": "0",
-        "polyamide_pct": "",
-        "acrylic_pct": "",
-        "elastane_pct": "1",
-        "color_main": "bleu",
-        "defects": "aucun défaut",
-        "size_label_visible": True,
-        "fabric_label_visible": True,
-    }
-
-    femme_payload = {**base_payload, "gender": "Femme", "sku": "JLF6"}
-    homme_payload = {**base_payload, "gender": "Homme", "sku": "JLF12"}
-    mix_payload = {**base_payload, "gender": "Mixte", "sku": "JLF3"}
-    tommy_payload = {**base_payload, "gender": "Femme", "sku": "PTF7"}
-
-    assert ListingFields.from_dict(femme_payload).sku == "JLF6"
-    assert ListingFields.from_dict(homme_payload).sku == "JLF12"
-    assert ListingFields.from_dict(mix_payload).sku == "JLF3"
-    tommy_fields = ListingFields.from_dict(
-        tommy_payload, template_name="template-pull-tommy-femme"
-    )
-    assert tommy_fields.sku == "PTF7"
-
-    with pytest.raises(ValueError):
-        ListingFields.from_dict(tommy_payload)
+@pytest.mark.parametrize(
+    ("gender", "sku", "template_name"),
+    [
+        ("Femme", "JLF6", None),
+        ("Homme", "JLF12", None),
+        ("Mixte", "JLF3", None),
+        ("Femme", "PTF7", "template-pull-tommy-femme"),
+    ],
+)
+def test_listing_fields_enforces_sku_prefix_by_gender(
+    gender: str, sku: str, template_name: str | None
+) -> None:
+    payload = {**_BASE_PAYLOAD, "gender": gender, "sku": sku}
 
-    with pytest.raises(ValueError):
-        ListingFields.from_dict({**base_payload, "gender": "Femme", "sku": "JLH7"})
+    assert ListingFields.from_dict(payload, template_name=template_name).sku == sku
 
-    with pytest.raises(ValueError):
-        ListingFields.from_dict({**base_payload, "gender": "Homme", "sku": "JLH9"})
 
+@pytest.mark.parametrize(
+    ("gender", "sku"),
+    [("Femme", "PTF7"), ("Femme", "JLH7"), ("Homme", "JLH9"), ("Homme", "PTF4")],
+)
+def test_listing_fields_rejects_sku_prefix_mismatch(gender: str, sku: str) -> None:
     with pytest.raises(ValueError):
-        ListingFields.from_dict({**base_payload, "gender": "Homme", "sku": "PTF4"})
+        _parse_fields(gender=gender, sku=sku)
 
 
 def test_listing_fields_rejects_unknown_defect_tags() -> None:
     payload = {
-        "model": "501",
-        "fr_size": "38",
-        "us_w": "28",
-        "us_l": "30",
-        "fit_leg": "bootcut",
-        "rise_class": "haute",
-        "rise_measurement_cm": "",
-        "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-        "cotton_pct": "99",
-        "polyester_pct": "0",
-        "viscose_pct": "0",
-        "polyamide_pct": "",
-        "acrylic_pct": "",
-        "elastane_pct": "1",
-        "gender": "Femme",
+        **_BASE_PAYLOAD,
         "color_main": "bleu",
-        "defects": "aucun défaut",
-        "sku": "JLF6",
         "defect_tags": ["unknown"],
+        "size_label_visible": False,
+        "fabric_label_visible": False,
     }
 
     with pytest.raises(ValueError):
@@ -178,26 +210,12 @@ def test_listing_fields_rejects_unknown_defect_tags() -> None:
 
 def test_listing_fields_splits_comma_separated_defect_tags() -> None:
     payload = {
-        "model": "501",
-        "fr_size": "38",
-        "us_w": "28",
-        "us_l": "30",
-        "fit_leg": "bootcut",
-        "rise_class": "haute",
-        "rise_measurement_cm": "",
-        "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-        "cotton_pct": "99",
-        "polyester_pct": "0",
-        "viscose_pct": "0",
-        "polyamide_pct": "",
-        "acrylic_pct": "",
-        "elastane_pct": "1",
-        "gender": "Femme",
+        **_BASE_PAYLOAD,
         "color_main": "bleu",
         "defects": "effets d'usure stylés",
-        "sku": "JLF6",
         "defect_tags": "stylish_holes, ripped",
+        "size_label_visible": False,
+        "fabric_label_visible": False,
     }
 
     fields = ListingFields.from_dict(payload)
@@ -206,15 +224,13 @@ def test_listing_fields_splits_comma_separated_defect_tags() -> None:
 
 def test_listing_fields_parse_new_measurements_for_tommy_template() -> None:
     payload = {
+        **_BASE_PAYLOAD,
         "model": "",
         "fr_size": "",
         "us_w": "",
         "us_l": "",
         "fit_leg": "",
         "rise_class": "",
-        "rise_measurement_cm": "",
-        "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
         "bust_flat_measurement_cm": "48,5 cm",
         "length_measurement_cm": "60",
         "sleeve_measurement_cm": "58 cm",
@@ -223,11 +239,8 @@ def test_listing_fields_parse_new_measurements_for_tommy_template() -> None:
         "hem_flat_measurement_cm": "47",
         "cotton_pct": "100",
         "polyester_pct": "",
-        "polyamide_pct": "",
         "viscose_pct": "",
-        "acrylic_pct": "",
         "elastane_pct": "",
-        "gender": "Femme",
         "color_main": "bleu",
         "defects": "",
         "sku": "PTF10",
@@ -239,37 +252,28 @@ def test_listing_fields_parse_new_measurements_for_tommy_template() -> None:
         payload, template_name="template-pull-tommy-femme"
     )
 
-    assert fields.bust_flat_measurement_cm == pytest.approx(48.5)
-    assert fields.length_measurement_cm == pytest.approx(60)
-    assert fields.sleeve_measurement_cm == pytest.approx(58)
-    assert fields.shoulder_measurement_cm == pytest.approx(38)
-    assert fields.waist_flat_measurement_cm == pytest.approx(46)
-    assert fields.hem_flat_measurement_cm == pytest.approx(47)
+    assert (
+        fields.bust_flat_measurement_cm,
+        fields.length_measurement_cm,
+        fields.sleeve_measurement_cm,
+        fields.shoulder_measurement_cm,
+        fields.waist_flat_measurement_cm,
+        fields.hem_flat_measurement_cm,
+    ) == pytest.approx((48.5, 60, 58, 38, 46, 47))
 
-def test_listing_fields_parses_visibility_flags() -> None:
+
+@pytest.mark.parametrize(
+    "flags",
+    [{"size_label_visible": "false", "fabric_label_visible": 0}, {}],
+    ids=["falsy-strings-and-ints", "missing"],
+)
+def test_listing_fields_parses_visibility_flags(flags: dict[str, Any]) -> None:
     payload = {
-        "model": "501",
-        "fr_size": "38",
-        "us_w": "28",
-        "us_l": "30",
-        "fit_leg": "bootcut",
-        "rise_class": "haute",
-        "rise_measurement_cm": "",
-        "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-        "cotton_pct": "99",
-        "polyester_pct": "0",
-        "viscose_pct": "0",
-        "polyamide_pct": "",
-        "acrylic_pct": "",
-        "elastane_pct": "1",
-        "gender": "Femme",
-        "color_main": "bleu",
-        "defects": "aucun défaut",
-        "sku": "JLF6",
-        "size_label_visible": "false",
-        "fabric_label_visible": 0,
+        key: value
+        for key, value in _BASE_PAYLOAD.items()
+        if key not in ("size_label_visible", "fabric_label_visible")
     }
+    payload.update(flags)
 
     fields = ListingFields.from_dict(payload)
     assert fields.size_label_visible is False
@@ -278,61 +282,29 @@ def test_listing_fields_parses_visibility_flags() -> None:
 
 def test_listing_fields_parses_waist_measurement() -> None:
     payload = {
-        "model": "501",
+        **_BASE_PAYLOAD,
         "fr_size": "",
         "us_w": "",
         "us_l": "",
         "fit_leg": "slim",
         "rise_class": "",
-        "rise_measurement_cm": "",
         "waist_measurement_cm": "74,5",
-        **MEASUREMENT_EMPTY,
         "cotton_pct": "",
         "polyester_pct": "",
-        "polyamide_pct": "",
         "viscose_pct": "",
-        "acrylic_pct": "",
         "elastane_pct": "",
         "gender": "",
         "color_main": "",
         "defects": "",
-        "defect_tags": [],
         "sku": "",
+        "size_label_visible": False,
+        "fabric_label_visible": False,
     }
 
     fields = ListingFields.from_dict(payload)
     assert fields.waist_measurement_cm == pytest.approx(74.5)
 
 
-def test_listing_fields_defaults_visibility_flags_to_false() -> None:
-    payload = {
-        "model": "501",
-        "fr_size": "38",
-        "us_w": "28",
-        "us_l": "30",
-        "fit_leg": "bootcut",
-        "rise_class": "haute",
-        "rise_measurement_cm": "",
-        "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-        "cotton_pct": "99",
-        "polyester_pct": "0",
-        "polyamide_pct": "",
-        "viscose_pct": "0",
-        "acrylic_pct": "",
-        "elastane_pct": "1",
-        "gender": "Femme",
-        "color_main": "Bleu",
-        "defects": "aucun défaut",
-        "sku": "JLF6",
-        "defect_tags": [],
-    }
-
-    fields = ListingFields.from_dict(payload)
-    assert fields.size_label_visible is False
-    assert fields.fabric_label_visible is False
-
-
 @pytest.mark.parametrize(
     ("measurement", "expected"),
     [
@@ -340,152 +312,50 @@ def test_listing_fields_defaults_visibility_flags_to_false() -> None:
         ("23,5", "moyenne"),
         ("32", "haute"),
         ("34", "très haute"),
+        ("non lisible", ""),
     ],
 )
 def test_listing_fields_resolves_rise_class_from_measurement(
     measurement: str, expected: str
-) -> None:
-    payload = {
-        "model": "501",
-        "fr_size": "38",
-        "us_w": "28",
-        "us_l": "30",
-        "fit_leg": "bootcut",
-        "rise_class": "",
-        "rise_measurement_cm": measurement,
-        "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-        "cotton_pct": "99",
-        "polyester_pct": "0",
-        "polyamide_pct": "",
-            "viscose_pct": "0",
-            "acrylic_pct": "",
-        "elastane_pct": "1",
-        "gender": "Femme",
-        "color_main": "Bleu",
-        "defects": "aucun défaut",
-        "sku": "JLF6",
-        "defect_tags": [],
-        "size_label_visible": False,
-        "fabric_label_visible": False,
-    }
-
-    fields = ListingFields.from_dict(payload)
-    assert fields.resolved_rise_class == expected
-
-
-def test_listing_fields_resolved_rise_class_handles_invalid_measurement() -> None:
-    payload = {
-        "model": "501",
-        "fr_size": "38",
-        "us_w": "28",
-        "us_l": "30",
-        "fit_leg": "bootcut",
-        "rise_class": "",
-        "rise_measurement_cm": "non lisible",
-        "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-        "cotton_pct": "99",
-        "polyester_pct": "0",
-        "polyamide_pct": "",
-            "viscose_pct": "0",
-            "acrylic_pct": "",
-        "elastane_pct": "1",
-        "gender": "Femme",
-        "color_main": "Bleu",
-        "defects": "aucun défaut",
-        "sku": "JLF6",
-        "defect_tags": [],
-        "size_label_visible": False,
-        "fabric_label_visible": False,
-    }
-
-    fields = ListingFields.from_dict(payload)
-    assert fields.resolved_rise_class == ""
-
-
-def test_listing_fields_resolved_rise_class_prefers_explicit_value() -> None:
-    payload = {
-        "model": "501",
-        "fr_size": "38",
-        "us_w": "28",
-        "us_l": "30",
-        "fit_leg": "bootcut",
-        "rise_class": "haute",
-        "rise_measurement_cm": "20",
-        "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-        "cotton_pct": "99",
-        "polyester_pct": "0",
-        "polyamide_pct": "",
-            "viscose_pct": "0",
-            "acrylic_pct": "",
-        "elastane_pct": "1",
-        "gender": "Femme",
-        "color_main": "Bleu",
-        "defects": "aucun défaut",
-        "sku": "JLF6",
-        "defect_tags": [],
-        "size_label_visible": False,
-        "fabric_label_visible": False,
-    }
-
-    fields = ListingFields.from_dict(payload)
-    assert fields.resolved_rise_class == "haute"
-
-
-def test_listing_fields_resolved_rise_class_uses_measurement_even_when_label_visible() -> None:
-    payload = {
-        "model": "501",
-        "fr_size": "38",
-        "us_w": "28",
-        "us_l": "30",
-        "fit_leg": "bootcut",
-        "rise_class": "",
-        "rise_measurement_cm": "28",
-        "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-        "cotton_pct": "99",
-        "polyester_pct": "0",
-        "polyamide_pct": "",
-            "viscose_pct": "0",
-            "acrylic_pct": "",
-        "elastane_pct": "1",
-        "gender": "Femme",
-        "color_main": "Bleu",
-        "defects": "aucun défaut",
-        "sku": "JLF6",
-        "defect_tags": [],
-        "size_label_visible": True,
+) -> None:
+    payload = {
+        **_BASE_PAYLOAD,
+        "rise_class": "",
+        "rise_measurement_cm": measurement,
+        "size_label_visible": False,
         "fabric_label_visible": False,
     }
 
+    fields = ListingFields.from_dict(payload)
+    assert fields.resolved_rise_class == expected
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        pytest.param(
+            {"rise_measurement_cm": "20", "size_label_visible": False},
+            id="explicit-class-wins",
+        ),
+        pytest.param(
+            {"rise_class": "", "rise_measurement_cm": "28"},
+            id="measurement-with-size-label-visible",
+        ),
+    ],
+)
+def test_listing_fields_resolved_rise_class_is_haute(overrides: dict[str, Any]) -> None:
+    payload = {**_BASE_PAYLOAD, **overrides, "fabric_label_visible": False}
+
     fields = ListingFields.from_dict(payload)
     assert fields.resolved_rise_class == "haute"
 
 
 def test_listing_fields_infers_defect_tag_from_text() -> None:
     payload = {
-        "model": "501",
-        "fr_size": "38",
-        "us_w": "28",
-        "us_l": "30",
-        "fit_leg": "bootcut",
-        "rise_class": "haute",
-        "rise_measurement_cm": "",
-        "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-        "cotton_pct": "99",
-        "polyester_pct": "0",
-        "polyamide_pct": "",
-            "viscose_pct": "0",
-            "acrylic_pct": "",
-        "elastane_pct": "1",
-        "gender": "Femme",
-        "color_main": "Bleu",
+        **_BASE_PAYLOAD,
         "defects": "Entrejambe délavée visible",
-        "sku": "JLF6",
-        "defect_tags": [],
+        "size_label_visible": False,
+        "fabric_label_visible": False,
     }
 
     fields = ListingFields.from_dict(payload)
@@ -493,48 +363,25 @@ def test_listing_fields_infers_defect_tag_from_text() -> None:
 
 
 def test_listing_fields_normalizes_model_code() -> None:
-    base_payload = {
-        "fr_size": "38",
-        "us_w": "28",
-        "us_l": "30",
-        "fit_leg": "bootcut",
-        "rise_class": "haute",
-        "rise_measurement_cm": "",
-        "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-        "cotton_pct": "99",
-        "polyester_pct": "0",
-        "polyamide_pct": "",
-            "viscose_pct": "0",
-            "acrylic_pct": "",
-        "elastane_pct": "1",
-        "gender": "Femme",
-        "color_main": "Bleu",
-        "defects": "aucun défaut",
-        "sku": "JLF6",
-        "size_label_visible": True,
-        "fabric_label_visible": True,
-    }
-
-    fields = ListingFields.from_dict({"model": "470 Signature super skinny", **base_payload})
+    fields = _parse_fields(model="470 Signature super skinny")
     assert fields.model == "470"
 
-    premium_fields = ListingFields.from_dict({"model": "501 premium stretch", **base_payload})
+    premium_fields = _parse_fields(model="501 premium stretch")
     assert premium_fields.model == "501 Premium"
 
-    wedgie_fields = ListingFields.from_dict({"model": "Wedgie501 premium", **base_payload})
+    wedgie_fields = _parse_fields(model="Wedgie501 premium")
     assert wedgie_fields.model == "501 Premium"
 
 
-@pytest.mark.parametrize(
-    "fit_leg,expected",
-    [
-        ("Bootcut", ("Bootcut/Évasé", "bootcut/évasé", "bootcut")),
-        ("bootcut / evase", ("Bootcut/Évasé", "bootcut/évasé", "bootcut")),
-        ("Skinny", ("Skinny", "skinny", "slim")),
-        ("droit", ("Straight/Droit", "straight/droit", "straight")),
-    ],
+_FIT_CASES: tuple[tuple[str, tuple[str, str, str]], ...] = (
+    ("Bootcut", ("Bootcut/Évasé", "bootcut/évasé", "bootcut")),
+    ("bootcut / evase", ("Bootcut/Évasé", "bootcut/évasé", "bootcut")),
+    ("Skinny", ("Skinny", "skinny", "slim")),
+    ("droit", ("Straight/Droit", "straight/droit", "straight")),
 )
+
+
+@pytest.mark.parametrize("fit_leg,expected", _FIT_CASES, ids=[case[0] for case in _FIT_CASES])
 def test_normalize_fit_terms_applies_double_wording(fit_leg: str, expected: tuple[str, str, str]) -> None:
     assert normalize_fit_terms(fit_leg) == expected
 
@@ -551,170 +398,58 @@ def test_normalize_sizes_applies_business_rules() -> None:
     assert regular.note is None
 
 
-def test_normalize_sizes_rounds_up_odd_us_when_requested() -> None:
-    computed: NormalizedSizes = normalize_sizes("31", None, False, ensure_even_fr=True)
-    assert computed.fr_size == "42"
-    assert computed.us_size == "31"
-    assert computed.note is None
-
-
-def test_normalize_sizes_keeps_labels_when_measurement_close() -> None:
-    computed: NormalizedSizes = normalize_sizes(
-        "31",
-        "42",
-        False,
-        ensure_even_fr=True,
-        waist_measurement_cm=43,
-    )
-    assert computed.fr_size == "42"
-    assert computed.us_size == "31"
-    assert computed.note is None
-
-
-def test_normalize_sizes_rounds_down_when_measurement_is_smaller() -> None:
-    computed: NormalizedSizes = normalize_sizes(
-        "31",
-        None,
-        False,
-        ensure_even_fr=True,
-        waist_measurement_cm=30,
-    )
-    assert computed.fr_size == "30"
-    assert computed.us_size is None
-    assert computed.note is not None
-    assert "~30 cm" in computed.note
-
-
-def test_normalize_sizes_rounds_up_when_measurement_is_larger() -> None:
-    computed: NormalizedSizes = normalize_sizes(
-        "31",
-        None,
-        False,
-        ensure_even_fr=True,
-        waist_measurement_cm=48,
-    )
-    assert computed.fr_size == "48"
-    assert computed.us_size is None
-    assert computed.note is not None
-    assert "~48 cm" in computed.note
-
-
-def test_normalize_sizes_falls_back_to_waist_measurement() -> None:
-    computed: NormalizedSizes = normalize_sizes(
-        None,
-        None,
-        False,
-        ensure_even_fr=True,
-        waist_measurement_cm=40,
-    )
-    assert computed.fr_size == "40"
-    assert computed.us_size is None
-    assert computed.note is not None
-    assert "~40 cm" in computed.note
-    assert "à plat" in computed.note
-
-
-def test_normalize_sizes_converts_small_flat_measurement() -> None:
-    computed: NormalizedSizes = normalize_sizes(
-        None,
-        None,
-        False,
-        ensure_even_fr=True,
-        waist_measurement_cm=33,
-    )
-    assert computed.fr_size == "32"
-    assert computed.us_size is None
-    assert computed.note is not None
-    assert "~33 cm" in computed.note
-
-
-def test_normalize_sizes_prefers_measurement_when_conflict() -> None:
-    computed: NormalizedSizes = normalize_sizes(
-        "31",
-        "42",
-        False,
-        ensure_even_fr=True,
-        waist_measurement_cm=33,
-    )
-    assert computed.fr_size == "32"
-    assert computed.us_size is None
-    assert computed.note is not None
-    assert "~33 cm" in computed.note
-
-
-def test_normalize_sizes_keeps_flat_measurement_without_labels() -> None:
-    computed: NormalizedSizes = normalize_sizes(
-        None,
-        None,
-        False,
-        ensure_even_fr=True,
-        waist_measurement_cm=40,
-    )
-
-    assert computed.fr_size == "40"
-    assert computed.us_size is None
-    assert computed.note is not None
-    assert "~40 cm" in computed.note
-    assert "à plat" in computed.note
-
-
-def test_normalize_sizes_respects_labels_with_flat_measurement() -> None:
-    computed: NormalizedSizes = normalize_sizes(
-        "31",
-        "42",
-        False,
-        ensure_even_fr=True,
-        waist_measurement_cm=40,
-    )
-
-    assert computed.fr_size == "42"
-    assert computed.us_size == "31"
-    assert computed.note is None
-
-
-def test_normalize_sizes_prefers_measurement_when_gap_is_smaller() -> None:
+@pytest.mark.parametrize(
+    ("us_w", "fr_size", "waist_measurement_cm", "expected_fr", "expected_us", "note_fragments"),
+    [
+        pytest.param("31", None, None, "42", "31", None, id="rounds-up-odd-us"),
+        pytest.param("31", "42", 43, "42", "31", None, id="keeps-labels-when-measurement-close"),
+        pytest.param("31", None, 30, "30", None, ("~30 cm",), id="rounds-down-to-measurement"),
+        pytest.param("31", None, 48, "48", None, ("~48 cm",), id="rounds-up-to-measurement"),
+        pytest.param(
+            None, None, 40, "40", None, ("~40 cm", "à plat"), id="falls-back-to-flat-measurement"
+        ),
+        pytest.param(None, None, 33, "32", None, ("~33 cm",), id="converts-small-flat-measurement"),
+        pytest.param("31", "42", 33, "32", None, ("~33 cm",), id="measurement-wins-conflict"),
+        pytest.param("31", "42", 40, "42", "31", None, id="respects-labels-with-flat-measurement"),
+        pytest.param("31", "42", 44, "42", "31", None, id="keeps-labels-when-gap-is-smaller"),
+    ],
+)
+def test_normalize_sizes_with_even_fr(
+    us_w: str | None,
+    fr_size: str | None,
+    waist_measurement_cm: float | None,
+    expected_fr: str,
+    expected_us: str | None,
+    note_fragments: tuple[str, ...] | None,
+) -> None:
     computed: NormalizedSizes = normalize_sizes(
-        "31",
-        "42",
+        us_w,
+        fr_size,
         False,
         ensure_even_fr=True,
-        waist_measurement_cm=44,
+        waist_measurement_cm=waist_measurement_cm,
     )
-    assert computed.fr_size == "42"
-    assert computed.us_size == "31"
-    assert computed.note is None
 
-
-def test_template_render_injects_normalized_terms(template_registry: ListingTemplateRegistry) -> None:
-    template = template_registry.get_template(template_registry.default_template)
-    fields = ListingFields.from_dict(
-        {
-            "model": "501",
-            "fr_size": "38",
-            "us_w": "28",
-            "us_l": "30",
-            "fit_leg": "bootcut / evase",
-            "rise_class": "haute",
-            "rise_measurement_cm": "",
-            "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-            "cotton_pct": "99",
-            "polyester_pct": "0",
-            "polyamide_pct": "",
-            "viscose_pct": "0",
-            "acrylic_pct": "",
-            "elastane_pct": "1",
-            "gender": "Femme",
-            "color_main": "Bleu",
-            "defects": "très légères traces d'usure",
-            "sku": "JLF6",
-            "defect_tags": ["faded_crotch"],
-            "size_label_visible": False,
-            "fabric_label_visible": False,
-        }
+    assert computed.fr_size == expected_fr
+    assert computed.us_size == expected_us
+    if note_fragments is None:
+        assert computed.note is None
+    else:
+        assert computed.note is not None
+        for fragment in note_fragments:
+            assert fragment in computed.note
+
+
+def test_template_render_injects_normalized_terms(default_template: ListingTemplate) -> None:
+    fields = _parse_fields(
+        fit_leg="bootcut / evase",
+        defects="très légères traces d'usure",
+        defect_tags=["faded_crotch"],
+        size_label_visible=False,
+        fabric_label_visible=False,
     )
 
-    title, description, _price = template.render(fields)
+    title, description, _price = default_template.render(fields)
     assert "Bootcut/Évasé" in title
     assert "bootcut/évasé" in description
     assert "haute" not in title.lower()
@@ -722,7 +457,7 @@ def test_template_render_injects_normalized_terms(template_registry: ListingTemp
     assert "Mesure FR" not in description
     assert " W" not in title  # no US size injected when label is hidden
     assert " L30" not in title
-    assert description.count(COMBINED_LABEL_CUT_MESSAGE) == 1
+    assert occurs_once(description, COMBINED_LABEL_CUT_MESSAGE)
     assert "Très bon état : entrejambe légèrement délavée (voir photos)" in description
     assert COMPOSITION_LABEL_CUT_MESSAGE not in description
     assert SIZE_LABEL_CUT_MESSAGE not in description
@@ -731,32 +466,12 @@ def test_template_render_injects_normalized_terms(template_registry: ListingTemp
 def test_render_template_prefers_measurement_when_conflict(
     template_registry: ListingTemplateRegistry,
 ) -> None:
-    fields = ListingFields.from_dict(
-        {
-            "model": "501",
-            "fr_size": "42",
-            "us_w": "31",
-            "us_l": "30",
-            "fit_leg": "bootcut",
-            "rise_class": "haute",
-            "rise_measurement_cm": "",
-            "waist_measurement_cm": "",
-            **MEASUREMENT_EMPTY,
-            "waist_flat_measurement_cm": "33",
-            "cotton_pct": "99",
-            "polyester_pct": "0",
-            "polyamide_pct": "",
-            "viscose_pct": "0",
-            "acrylic_pct": "",
-            "elastane_pct": "0",
-            "gender": "Femme",
-            "color_main": "Bleu",
-            "defects": "aucun défaut",
-            "sku": "JLF6",
-            "defect_tags": [],
-            "size_label_visible": True,
-            "fabric_label_visible": False,
-        }
+    fields = _parse_fields(
+        fr_size="42",
+        us_w="31",
+        waist_flat_measurement_cm="33",
+        elastane_pct="0",
+        fabric_label_visible=False,
     )
 
     title, description, _price = render_template_jean_levis_femme(fields)
@@ -770,37 +485,11 @@ def test_render_template_prefers_measurement_when_conflict(
 
 
 def test_template_render_translates_main_color_to_french(
-    template_registry: ListingTemplateRegistry,
+    default_template: ListingTemplate,
 ) -> None:
-    template = template_registry.get_template(template_registry.default_template)
-    fields = ListingFields.from_dict(
-        {
-            "model": "501",
-            "fr_size": "38",
-            "us_w": "28",
-            "us_l": "30",
-            "fit_leg": "bootcut",
-            "rise_class": "haute",
-            "rise_measurement_cm": "",
-            "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-            "cotton_pct": "99",
-            "polyester_pct": "0",
-            "polyamide_pct": "",
-            "viscose_pct": "0",
-            "acrylic_pct": "",
-            "elastane_pct": "1",
-            "gender": "Femme",
-            "color_main": "black",
-            "defects": "aucun défaut",
-            "sku": "JLF6",
-            "defect_tags": [],
-            "size_label_visible": True,
-            "fabric_label_visible": True,
-        }
-    )
+    fields = replace(_BASE_FIELDS, color_main="black")
 
-    title, description, _price = template.render(fields)
+    title, description, _price = default_template.render(fields)
 
     assert "noir" in title
     assert "Coloris noir" in description
@@ -808,37 +497,23 @@ def test_template_render_translates_main_color_to_french(
 
 
 def test_template_render_handles_viscose_composition(
-    template_registry: ListingTemplateRegistry,
+    default_template: ListingTemplate,
 ) -> None:
-    template = template_registry.get_template(template_registry.default_template)
-    fields = ListingFields.from_dict(
-        {
-            "model": "724",
-            "fr_size": "40",
-            "us_w": "30",
-            "us_l": "32",
-            "fit_leg": "straight",
-            "rise_class": "moyenne",
-            "rise_measurement_cm": "",
-            "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-            "cotton_pct": "60",
-            "polyester_pct": "10",
-            "polyamide_pct": "",
-            "viscose_pct": "30",
-            "acrylic_pct": "",
-            "elastane_pct": "0",
-            "gender": "Femme",
-            "color_main": "Bleu",
-            "defects": "aucun défaut",
-            "sku": "JLF15",
-            "defect_tags": [],
-            "size_label_visible": True,
-            "fabric_label_visible": True,
-        }
+    fields = _parse_fields(
+        model="724",
+        fr_size="40",
+        us_w="30",
+        us_l="32",
+        fit_leg="straight",
+        rise_class="moyenne",
+        cotton_pct="60",
+        polyester_pct="10",
+        viscose_pct="30",
+        elastane_pct="0",
+        sku="JLF15",
     )
 
-    title, description, _price = template.render(fields)
+    title, description, _price = default_template.render(fields)
     assert fields.has_viscose is True
     assert "30% viscose" not in title
     assert "60% coton" in title
@@ -846,75 +521,31 @@ def test_template_render_handles_viscose_composition(
 
 
 def test_template_render_mentions_wool_cashmere_nylon(
-    template_registry: ListingTemplateRegistry,
+    jean_levis_femme_template: ListingTemplate,
 ) -> None:
-    template = template_registry.get_template("template-jean-levis-femme")
-    fields = ListingFields.from_dict(
-        {
-            "model": "721",
-            "fr_size": "38",
-            "us_w": "28",
-            "us_l": "32",
-            "fit_leg": "slim",
-            "rise_class": "moyenne",
-            "rise_measurement_cm": "",
-            "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-            "cotton_pct": "70",
-            "wool_pct": "20",
-            "cashmere_pct": "5",
-            "nylon_pct": "5",
-            "polyester_pct": "0",
-            "polyamide_pct": "",
-            "viscose_pct": "0",
-            "acrylic_pct": "",
-            "elastane_pct": "0",
-            "gender": "Femme",
-            "color_main": "Bleu",
-            "defects": "aucun défaut",
-            "sku": "JLF7",
-            "defect_tags": [],
-            "size_label_visible": True,
-            "fabric_label_visible": True,
-        }
+    fields = _parse_fields(
+        model="721",
+        us_l="32",
+        fit_leg="slim",
+        rise_class="moyenne",
+        cotton_pct="70",
+        wool_pct="20",
+        cashmere_pct="5",
+        nylon_pct="5",
+        elastane_pct="0",
+        sku="JLF7",
     )
 
-    _title, description, _price = template.render(fields)
+    _title, description, _price = jean_levis_femme_template.render(fields)
     assert (
         "Composition : 70% coton, 20% laine, 5% cachemire et 5% nylon." in description
     )
 
 
-def test_template_render_combines_related_defects(template_registry: ListingTemplateRegistry) -> None:
-    template = template_registry.get_template(template_registry.default_template)
-    fields = ListingFields.from_dict(
-        {
-            "model": "501",
-            "fr_size": "38",
-            "us_w": "28",
-            "us_l": "30",
-            "fit_leg": "bootcut",
-            "rise_class": "haute",
-            "rise_measurement_cm": "",
-            "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-            "cotton_pct": "99",
-            "polyester_pct": "0",
-            "polyamide_pct": "",
-            "viscose_pct": "0",
-            "acrylic_pct": "",
-            "elastane_pct": "1",
-            "gender": "Femme",
-            "color_main": "Bleu",
-            "defects": "traces stylées",
-            "sku": "JLF6",
-            "defect_tags": ["stylish_holes", "ripped"],
-            "size_label_visible": True,
-            "fabric_label_visible": True,
-        }
-    )
+def test_template_render_combines_related_defects(default_template: ListingTemplate) -> None:
+    fields = _parse_fields(defects="traces stylées", defect_tags=["stylish_holes", "ripped"])
 
-    _title, description, _price = template.render(fields)
+    _title, description, _price = default_template.render(fields)
     assert (
         "Très bon état : Quelques trous discrets et effets déchirés (voir photos)"
         in description
@@ -924,197 +555,113 @@ def test_template_render_combines_related_defects(template_registry: ListingTemp
 
 
 def test_template_pull_tommy_mentions_nylon_and_acrylic(
-    template_registry: ListingTemplateRegistry,
+    pull_tommy_femme_template: ListingTemplate,
 ) -> None:
-    template = template_registry.get_template("template-pull-tommy-femme")
     fields = ListingFields.from_dict(
         {
+            **_BASE_PAYLOAD,
             "model": "",
             "fr_size": "M",
             "us_w": "",
             "us_l": "",
             "fit_leg": "",
             "rise_class": "",
-            "rise_measurement_cm": "",
-            "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
             "cotton_pct": "65",
             "wool_pct": "25",
             "cashmere_pct": "5",
             "nylon_pct": "5",
-            "polyester_pct": "0",
-            "polyamide_pct": "",
-            "viscose_pct": "0",
             "acrylic_pct": "5",
             "elastane_pct": "0",
-            "gender": "Femme",
             "color_main": "Marine",
             "defects": "",
             "sku": "PTF2",
-            "defect_tags": [],
-            "size_label_visible": True,
-            "fabric_label_visible": True,
             "knit_pattern": "torsadé",
             "made_in": "Made in Italy",
         },
         template_name="template-pull-tommy-femme",
     )
 
-    _title, description, _price = template.render(fields)
+    _title, description, _price = pull_tommy_femme_template.render(fields)
     assert (
         "Composition : 65% coton, 25% laine, 5% cachemire, 5% acrylique et 5% nylon." in description
     )
 
 
+@pytest.mark.parametrize(
+    ("size_label_visible", "fabric_label_visible", "expected_message"),
+    [
+        (False, True, SIZE_LABEL_CUT_MESSAGE),
+        (True, False, COMPOSITION_LABEL_CUT_MESSAGE),
+        (False, False, COMBINED_LABEL_CUT_MESSAGE),
+    ],
+    ids=["size-hidden", "fabric-hidden", "both-hidden"],
+)
 def test_template_render_mentions_missing_labels_individually(
-    template_registry: ListingTemplateRegistry,
+    default_template: ListingTemplate,
+    size_label_visible: bool,
+    fabric_label_visible: bool,
+    expected_message: str,
 ) -> None:
-    template = template_registry.get_template(template_registry.default_template)
-    base_payload = {
-        "model": "501",
-        "fr_size": "38",
-        "us_w": "28",
-        "us_l": "30",
-        "fit_leg": "bootcut",
-        "rise_class": "haute",
-        "rise_measurement_cm": "",
-        "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-        "cotton_pct": "99",
-        "polyester_pct": "0",
-        "polyamide_pct": "",
-            "viscose_pct": "0",
-            "acrylic_pct": "",
-        "elastane_pct": "1",
-        "gender": "Femme",
-        "color_main": "Bleu",
-        "defects": "aucune anomalie",
-        "sku": "JLF6",
-        "defect_tags": [],
-    }
-
-    size_hidden = ListingFields.from_dict(
-        {**base_payload, "size_label_visible": False, "fabric_label_visible": True}
+    fields = _parse_fields(
+        defects="aucune anomalie",
+        size_label_visible=size_label_visible,
+        fabric_label_visible=fabric_label_visible,
     )
-    _title, size_description, _price = template.render(size_hidden)
-    assert SIZE_LABEL_CUT_MESSAGE in size_description
 
-    fabric_hidden = ListingFields.from_dict(
-        {**base_payload, "size_label_visible": True, "fabric_label_visible": False}
-    )
-    _title, fabric_description, _price = template.render(fabric_hidden)
-    assert COMPOSITION_LABEL_CUT_MESSAGE in fabric_description
+    _title, description, _price = default_template.render(fields)
+    assert expected_message in description
 
 
 def test_template_render_uses_waist_measurement_when_label_hidden(
-    template_registry: ListingTemplateRegistry,
+    default_template: ListingTemplate,
 ) -> None:
-    template = template_registry.get_template(template_registry.default_template)
-    fields = ListingFields.from_dict(
-        {
-            "model": "501",
-            "fr_size": "",
-            "us_w": "",
-            "us_l": "",
-            "fit_leg": "straight",
-            "rise_class": "moyenne",
-            "rise_measurement_cm": "",
-            "waist_measurement_cm": "",
-            **MEASUREMENT_EMPTY,
-            "waist_flat_measurement_cm": "44",
-            "cotton_pct": "99",
-            "polyester_pct": "0",
-            "polyamide_pct": "",
-            "viscose_pct": "0",
-            "acrylic_pct": "",
-            "elastane_pct": "1",
-            "gender": "Femme",
-            "color_main": "Bleu",
-            "defects": "aucun défaut",
-            "sku": "",
-            "defect_tags": [],
-            "size_label_visible": False,
-            "fabric_label_visible": False,
-        }
+    fields = _parse_fields(
+        fr_size="",
+        us_w="",
+        us_l="",
+        fit_leg="straight",
+        rise_class="moyenne",
+        waist_flat_measurement_cm="44",
+        sku="",
+        size_label_visible=False,
+        fabric_label_visible=False,
     )
 
-    title, description, _price = template.render(fields)
+    title, description, _price = default_template.render(fields)
 
     assert "FR44" in title
     assert "Taille 44 FR" in description
-    assert description.count(COMBINED_LABEL_CUT_MESSAGE) == 1
+    assert occurs_once(description, COMBINED_LABEL_CUT_MESSAGE)
     assert COMPOSITION_LABEL_CUT_MESSAGE not in description
     assert SIZE_LABEL_CUT_MESSAGE not in description
 
 
-def test_template_render_mentions_polyester(template_registry: ListingTemplateRegistry) -> None:
-    template = template_registry.get_template(template_registry.default_template)
-    fields = ListingFields.from_dict(
-        {
-            "model": "501",
-            "fr_size": "40",
-            "us_w": "30",
-            "us_l": "30",
-            "fit_leg": "slim",
-            "rise_class": "moyenne",
-            "rise_measurement_cm": "",
-            "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-            "cotton_pct": "60",
-            "polyester_pct": "35",
-            "polyamide_pct": "",
-            "viscose_pct": "0",
-            "acrylic_pct": "",
-            "elastane_pct": "5",
-            "gender": "Femme",
-            "color_main": "Bleu",
-            "defects": "aucune anomalie",
-            "sku": "JLF8",
-            "defect_tags": [],
-            "size_label_visible": True,
-            "fabric_label_visible": True,
-        }
+def test_template_render_mentions_polyester(default_template: ListingTemplate) -> None:
+    fields = _parse_fields(
+        fr_size="40",
+        us_w="30",
+        fit_leg="slim",
+        rise_class="moyenne",
+        cotton_pct="60",
+        polyester_pct="35",
+        elastane_pct="5",
+        defects="aucune anomalie",
+        sku="JLF8",
     )
 
     assert fields.has_polyester is True
-    _title, description, _price = template.render(fields)
+    _title, description, _price = default_template.render(fields)
     assert "Composition : 60% coton, 35% polyester et 5% élasthanne." in description
 
 
 def test_template_render_skips_composition_when_label_missing(
-    template_registry: ListingTemplateRegistry,
+    default_template: ListingTemplate,
 ) -> None:
-    template = template_registry.get_template(template_registry.default_template)
-    fields = ListingFields.from_dict(
-        {
-            "model": "501",
-            "fr_size": "38",
-            "us_w": "28",
-            "us_l": "30",
-            "fit_leg": "bootcut",
-            "rise_class": "haute",
-            "rise_measurement_cm": "",
-            "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-            "cotton_pct": "99",
-            "polyester_pct": "0",
-            "polyamide_pct": "",
-            "viscose_pct": "0",
-            "acrylic_pct": "",
-            "elastane_pct": "1",
-            "gender": "Femme",
-            "color_main": "Bleu",
-            "defects": "aucune anomalie",
-            "sku": "JLF6",
-            "defect_tags": [],
-            "size_label_visible": True,
-            "fabric_label_visible": False,
-        }
-    )
+    fields = _parse_fields(defects="aucune anomalie", fabric_label_visible=False)
 
-    title, description, _price = template.render(fields)
+    title, description, _price = default_template.render(fields)
     assert "coton" not in title.lower()
-    assert description.count(COMPOSITION_LABEL_CUT_MESSAGE) == 1
+    assert occurs_once(description, COMPOSITION_LABEL_CUT_MESSAGE)
     assert COMBINED_LABEL_CUT_MESSAGE not in description
     assert SIZE_LABEL_CUT_MESSAGE not in description
     assert "% polyester" not in description
@@ -1122,31 +669,11 @@ def test_template_render_skips_composition_when_label_missing(
 
 
 def test_listing_fields_resets_fiber_flags_when_label_missing() -> None:
-    fields = ListingFields.from_dict(
-        {
-            "model": "501",
-            "fr_size": "38",
-            "us_w": "28",
-            "us_l": "30",
-            "fit_leg": "bootcut",
-            "rise_class": "haute",
-            "rise_measurement_cm": "",
-            "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-            "cotton_pct": "99",
-            "polyester_pct": "12",
-            "polyamide_pct": "",
-            "viscose_pct": "0",
-            "acrylic_pct": "",
-            "elastane_pct": "2",
-            "gender": "Femme",
-            "color_main": "Bleu",
-            "defects": "aucune anomalie",
-            "sku": "JLF6",
-            "defect_tags": [],
-            "size_label_visible": True,
-            "fabric_label_visible": False,
-        }
+    fields = _parse_fields(
+        polyester_pct="12",
+        elastane_pct="2",
+        defects="aucune anomalie",
+        fabric_label_visible=False,
     )
 
     assert fields.has_polyester is False
@@ -1156,79 +683,49 @@ def test_listing_fields_resets_fiber_flags_when_label_missing() -> None:
 
 @pytest.mark.parametrize("model_value", [None, ""])
 def test_template_render_omits_model_when_missing(
-    template_registry: ListingTemplateRegistry, model_value: str | None
+    default_template: ListingTemplate, model_value: str | None
 ) -> None:
-    template = template_registry.get_template(template_registry.default_template)
     payload = {
-        "fr_size": "38",
-        "us_w": "28",
-        "us_l": "30",
-        "fit_leg": "bootcut",
-        "rise_class": "haute",
-        "rise_measurement_cm": "",
-        "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-        "cotton_pct": "99",
-        "polyester_pct": "0",
-        "polyamide_pct": "",
-            "viscose_pct": "0",
-            "acrylic_pct": "",
-        "elastane_pct": "1",
-        "gender": "Femme",
-        "color_main": "Bleu",
+        **_BASE_PAYLOAD,
         "defects": "aucune anomalie",
-        "sku": "JLF6",
-        "defect_tags": [],
-        "size_label_visible": True,
-        "fabric_label_visible": True,
         "model": model_value,
     }
 
     fields = ListingFields.from_dict(payload)
-    title, description, _price = template.render(fields)
+    title, description, _price = default_template.render(fields)
 
     assert "  " not in title
     assert not title.startswith("Jean Levi’s  ")
     assert title.split()[0:2] == ["Jean", "Levi’s"]
 
-    first_paragraph = description.split("\n\n")[0]
-    first_sentence = first_paragraph.split("\n")[0]
+    first_sentence = _paragraph_first_line(description, 0)
     assert first_sentence == "Jean Levi’s pour Femme."
     assert "modèle" not in first_sentence
 
 
 def test_template_render_avoids_defaulting_missing_fields(
-    template_registry: ListingTemplateRegistry,
+    default_template: ListingTemplate,
 ) -> None:
-    template = template_registry.get_template(template_registry.default_template)
-    fields = ListingFields.from_dict(
-        {
-            "model": "",
-            "fr_size": "",
-            "us_w": "",
-            "us_l": "",
-            "fit_leg": "",
-            "rise_class": "",
-            "rise_measurement_cm": "",
-            "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-            "cotton_pct": "",
-            "polyester_pct": "",
-            "polyamide_pct": "",
-            "viscose_pct": "",
-            "acrylic_pct": "",
-            "elastane_pct": "",
-            "gender": "",
-            "color_main": "",
-            "defects": "",
-            "sku": "",
-            "defect_tags": [],
-            "size_label_visible": False,
-            "fabric_label_visible": False,
-        }
+    fields = _parse_fields(
+        model="",
+        fr_size="",
+        us_w="",
+        us_l="",
+        fit_leg="",
+        rise_class="",
+        cotton_pct="",
+        polyester_pct="",
+        viscose_pct="",
+        elastane_pct="",
+        gender="",
+        color_main="",
+        defects="",
+        sku="",
+        size_label_visible=False,
+        fabric_label_visible=False,
     )
 
-    title, description, _price = template.render(fields)
+    title, description, _price = default_template.render(fields)
     assert "femme" not in title.lower()
     assert "bleu" not in title.lower()
     assert "femme" not in description.lower()
@@ -1237,232 +734,54 @@ def test_template_render_avoids_defaulting_missing_fields(
     assert "coupe non précisée" in description.lower()
 
 
-def test_generator_parses_json_and_renders(template_registry: ListingTemplateRegistry) -> None:
-    template = template_registry.get_template(template_registry.default_template)
-    generator = ListingGenerator(model="test-model", api_key="dummy")
-
-    class _FakeContent:
-        def __init__(self, text: str) -> None:
-            self.text = text
-
-    class _FakeBlock:
-        def __init__(self, text: str) -> None:
-            self.content = [_FakeContent(text)]
-
-    class _FakeResponse:
-        def __init__(self, text: str) -> None:
-            self.output = [_FakeBlock(text)]
-
-    fields_json = {
-        "fields": {
-            "model": "501",
-            "fr_size": "44",
-            "us_w": "28",
-            "us_l": "30",
-            "fit_leg": "slim",
-            "rise_class": "moyenne",
-            "rise_measurement_cm": "",
-            "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-            "cotton_pct": "99",
-            "polyester_pct": "0",
-            "polyamide_pct": "",
-            "viscose_pct": "0",
-            "acrylic_pct": "",
-            "elastane_pct": "1",
-            "gender": "Femme",
-            "color_main": "Bleu",
-            "defects": "aucune anomalie",
-            "sku": "JLF6",
-            "defect_tags": [],
-            "size_label_visible": True,
-            "fabric_label_visible": True,
-        }
-    }
-
-    class _FakeResponses:
-        def __init__(self, text: str) -> None:
-            self._text = text
-
-        def create(self, **_kwargs: object) -> _FakeResponse:
-            return _FakeResponse(self._text)
-
-    class _FakeClient:
-        def __init__(self, text: str) -> None:
-            self.responses = _FakeResponses(text)
-
-    json_text = json.dumps(fields_json)
-    generator._client = _FakeClient(json_text)  # type: ignore[attr-defined]
+@pytest.mark.parametrize(
+    ("json_text", "sku_missing"),
+    [
+        pytest.param(_FIELDS_JSON_TEXT, False, id="valid-sku"),
+        pytest.param(_INVALID_SKU_FIELDS_JSON_TEXT, True, id="invalid-levis-sku"),
+    ],
+)
+def test_generator_parses_json_and_renders(
+    default_template: ListingTemplate,
+    generator: ListingGenerator,
+    json_text: str,
+    sku_missing: bool,
+) -> None:
+    generator._client = FakeBlockClient(json_text)  # type: ignore[attr-defined]
 
-    result = generator.generate_listing([], "", template)
+    result = generator.generate_listing([], "", default_template)
 
     assert "Skinny" in result.title
     assert "skinny" in result.description
+    assert result.sku_missing is sku_missing
 
 
-def test_generator_tolerates_invalid_levis_sku(template_registry: ListingTemplateRegistry) -> None:
-    template = template_registry.get_template("template-jean-levis-femme")
-    generator = ListingGenerator(model="test-model", api_key="dummy")
-
-    class _FakeContent:
-        def __init__(self, text: str) -> None:
-            self.text = text
-
-    class _FakeBlock:
-        def __init__(self, text: str) -> None:
-            self.content = [_FakeContent(text)]
-
-    class _FakeResponse:
-        def __init__(self, text: str) -> None:
-            self.output = [_FakeBlock(text)]
-
-    invalid_fields_json = {
-        "fields": {
-            "model": "501",
-            "fr_size": "44",
-            "us_w": "28",
-            "us_l": "30",
-            "fit_leg": "slim",
-            "rise_class": "moyenne",
-            "rise_measurement_cm": "",
-            "waist_measurement_cm": "",
-            **MEASUREMENT_EMPTY,
-            "cotton_pct": "99",
-            "polyester_pct": "0",
-            "polyamide_pct": "",
-            "viscose_pct": "0",
-            "acrylic_pct": "",
-            "elastane_pct": "1",
-            "gender": "Femme",
-            "color_main": "Bleu",
-            "defects": "aucune anomalie",
-            "sku": "PTF12",
-            "defect_tags": [],
-            "size_label_visible": True,
-            "fabric_label_visible": True,
-        }
-    }
-
-    class _FakeResponses:
-        def __init__(self, text: str) -> None:
-            self._text = text
-
-        def create(self, **_kwargs: object) -> _FakeResponse:
-            return _FakeResponse(self._text)
-
-    class _FakeClient:
-        def __init__(self, text: str) -> None:
-            self.responses = _FakeResponses(text)
-
-    generator._client = _FakeClient(json.dumps(invalid_fields_json))  # type: ignore[attr-defined]
-
-    result = generator.generate_listing([], "", template)
-
-    assert result.sku_missing is True
-
-
-def test_template_render_falls_back_to_free_text(template_registry: ListingTemplateRegistry) -> None:
-    template = template_registry.get_template(template_registry.default_template)
-    fields = ListingFields.from_dict(
-        {
-            "model": "501",
-            "fr_size": "38",
-            "us_w": "28",
-            "us_l": "30",
-            "fit_leg": "bootcut",
-            "rise_class": "haute",
-            "rise_measurement_cm": "",
-            "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-            "cotton_pct": "99",
-            "polyester_pct": "0",
-            "polyamide_pct": "",
-            "viscose_pct": "0",
-            "acrylic_pct": "",
-            "elastane_pct": "1",
-            "gender": "Femme",
-            "color_main": "Bleu",
-            "defects": "usure légère sur la poche arrière",
-            "sku": "JLF6",
-            "defect_tags": [],
-            "size_label_visible": True,
-            "fabric_label_visible": True,
-        }
-    )
+def test_template_render_falls_back_to_free_text(default_template: ListingTemplate) -> None:
+    fields = replace(_BASE_FIELDS, defects="usure légère sur la poche arrière")
 
-    _title, description, _price = template.render(fields)
+    _title, description, _price = default_template.render(fields)
     assert "usure légère sur la poche arrière" in description
 
 
-def test_template_render_ignores_positive_defect_phrase(
-    template_registry: ListingTemplateRegistry,
-) -> None:
-    template = template_registry.get_template(template_registry.default_template)
-    fields = ListingFields.from_dict(
-        {
-            "model": "501",
-            "fr_size": "38",
-            "us_w": "28",
-            "us_l": "30",
-            "fit_leg": "bootcut",
-            "rise_class": "haute",
-            "rise_measurement_cm": "",
-            "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-            "cotton_pct": "99",
-            "polyester_pct": "0",
-            "polyamide_pct": "",
-            "viscose_pct": "0",
-            "acrylic_pct": "",
-            "elastane_pct": "1",
-            "gender": "Femme",
-            "color_main": "Bleu",
-            "defects": "Très bon état",
-            "sku": "JLF6",
-            "defect_tags": [],
-            "size_label_visible": True,
-            "fabric_label_visible": True,
-        }
-    )
-
-    _title, description, _price = template.render(fields)
-    third_paragraph = description.split("\n\n")[2].split("\n")[0]
-    assert third_paragraph == "Très bon état"
-
-
-def test_template_render_mentions_catalog_defect_without_duplication(
-    template_registry: ListingTemplateRegistry,
+@pytest.mark.parametrize(
+    ("overrides", "expected_line"),
+    [
+        pytest.param(
+            {"defects": "Très bon état"},
+            "Très bon état",
+            id="ignores-positive-phrase",
+        ),
+        pytest.param(
+            {"defects": "", "defect_tags": ["faded_crotch"]},
+            "Très bon état : entrejambe légèrement délavée (voir photos)",
+            id="catalog-defect-without-duplication",
+        ),
+    ],
+)
+def test_template_render_defect_paragraph(
+    default_template: ListingTemplate, overrides: dict[str, Any], expected_line: str
 ) -> None:
-    template = template_registry.get_template(template_registry.default_template)
-    fields = ListingFields.from_dict(
-        {
-            "model": "501",
-            "fr_size": "38",
-            "us_w": "28",
-            "us_l": "30",
-            "fit_leg": "bootcut",
-            "rise_class": "haute",
-            "rise_measurement_cm": "",
-            "waist_measurement_cm": "",
-        **MEASUREMENT_EMPTY,
-            "cotton_pct": "99",
-            "polyester_pct": "0",
-            "polyamide_pct": "",
-            "viscose_pct": "0",
-            "acrylic_pct": "",
-            "elastane_pct": "1",
-            "gender": "Femme",
-            "color_main": "Bleu",
-            "defects": "",
-            "sku": "JLF6",
-            "defect_tags": ["faded_crotch"],
-            "size_label_visible": True,
-            "fabric_label_visible": True,
-        }
-    )
-
-    _title, description, _price = template.render(fields)
-    third_paragraph = description.split("\n\n")[2].split("\n")[0]
-    assert third_paragraph == "Très bon état : entrejambe légèrement délavée (voir photos)"
-    assert "Très bon état général" not in third_paragraph
+    fields = _parse_fields(**overrides)
 
+    _title, description, _price = default_template.render(fields)
+    assert _paragraph_first_line(description, 2) == expected_line